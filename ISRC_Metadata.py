@@ -1,15 +1,66 @@
+import sys
 from dataclasses import dataclass
+from typing import Any, Optional
 
-@dataclass
+# Low-cardinality fields that repeat across a library; equal values share one string.
+_INTERNED_FIELDS = ("recordingArtistName", "isrcFailureCode")
+
+
+def _as_bool(value: Any) -> bool:
+    """The api reports flags as "True"/"False" strings"""
+    return value is True or (type(value) is str and value.lower() == "true")
+
+
+def _as_int(value: Any) -> Optional[int]:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+@dataclass(frozen=True)
 class ISRCMetadata:
+    __slots__ = ("duration", "recordingVersion", "isValidIsrc", "recordingYear",
+                 "recordingArtistName", "isExplicit", "isrc", "isrcFailureCode",
+                 "recordingTitle", "id")
+
     duration: str
     recordingVersion: str
-    isValidIsrc: str
-    recordingYear: str
+    isValidIsrc: bool
+    recordingYear: Optional[int]
     recordingArtistName: str
-    isExplicit: str
+    isExplicit: bool
     isrc: str
     isrcFailureCode: str
     recordingTitle: str
     id: str
 
+    def __post_init__(self):
+        for name in _INTERNED_FIELDS:
+            value = getattr(self, name)
+            if type(value) is str:
+                object.__setattr__(self, name, sys.intern(value))
+
+    def __reduce__(self):
+        # Frozen instances can't have their slots restored by the default
+        # pickle protocol, so rebuild them through __init__ instead.
+        return (self.__class__, tuple(getattr(self, name) for name in self.__slots__))
+
+    @classmethod
+    def from_isrc_response(cls, recording: dict) -> "ISRCMetadata":
+        """Builds the metadata from one entry of the api's "recordings" list.
+        Missing keys default to "" and unknown keys are ignored.
+        The flags are converted to bool and the year to int (None if missing or not a number).
+        """
+        get = recording.get
+        return cls(duration=get("duration", ""),
+                   recordingVersion=get("recordingVersion", ""),
+                   isValidIsrc=_as_bool(get("isValidIsrc")),
+                   recordingYear=_as_int(get("recordingYear")),
+                   recordingArtistName=get("recordingArtistName", ""),
+                   isExplicit=_as_bool(get("isExplicit")),
+                   isrc=get("isrc", ""),
+                   isrcFailureCode=get("isrcFailureCode", ""),
+                   recordingTitle=get("recordingTitle", ""),
+                   id=get("id", ""))
+
@@ -1,10 +1,142 @@
+import os
+import sqlite3
+import sys
 from dataclasses import dataclass
+from typing import Optional
 
-@dataclass
+# Low-cardinality fields that repeat across a library; equal values share one string.
+_INTERNED_FIELDS = ("Artist", "AlbumArtist", "Year")
+
+@dataclass(frozen=True)
 class SongMetadata:
+    __slots__ = ("Artist", "Title", "Year", "ISRC", "AlbumArtist", "FilePath")
+
     Artist: str
     Title: str
     Year: str
     ISRC: str
     AlbumArtist: str
     FilePath: str
+
+    def __post_init__(self):
+        for name in _INTERNED_FIELDS:
+            value = getattr(self, name)
+            if type(value) is str:
+                object.__setattr__(self, name, sys.intern(value))
+
+    def __reduce__(self):
+        # Frozen instances can't have their slots restored by the default
+        # pickle protocol, so rebuild them through __init__ instead.
+        return (self.__class__, tuple(getattr(self, name) for name in self.__slots__))
+
+
+class MetadataCache:
+    """Persistent cache of SongMetadata keyed by file path, stored in a sqlite table.
+    An entry is only used while the file's modification time and size are unchanged,
+    so re-scanning a library only reads the metadata of new or modified files.
+    The table is read once when the cache is created.
+    Entries are written in batches; call flush() before committing the connection.
+    """
+    BatchSize = 100
+
+    def __init__(self, connection: sqlite3.Connection) -> None:
+        self.connection = connection
+        self.connection.execute("CREATE TABLE IF NOT EXISTS metadata_cache ("
+                                "path TEXT PRIMARY KEY, mtime_ns INTEGER, size INTEGER, "
+                                "artist TEXT, title TEXT, year TEXT, isrc TEXT, album_artist TEXT)")
+        # (mtime_ns, size, artist, title, year, isrc, album_artist) of every cached path
+        self._entries: dict[str, tuple] = {
+            row[0]: row[1:] for row in self.connection.execute(
+                "SELECT path, mtime_ns, size, artist, title, year, isrc, album_artist FROM metadata_cache")}
+        self._pending: list[tuple] = []
+        # (mtime_ns, size) of paths that missed in get(), reused by put().
+        self._missed_stats: dict[str, tuple[int, int]] = {}
+
+    def get(self, path: str, stat: Optional[tuple[int, int]] = None) -> Optional[SongMetadata]:
+        """:param stat: (mtime_ns, size) of the file, if the caller has already stat'ed it
+        :returns the cached metadata of the file, or None if it is not cached or has changed
+        """
+        if stat is None:
+            try:
+                st = os.stat(path)
+            except OSError:
+                return None
+            stat = (st.st_mtime_ns, st.st_size)
+        row = self._entries.get(path)
+        if row is not None and row[0] == stat[0] and row[1] == stat[1]:
+            return SongMetadata(Artist=row[2], Title=row[3], Year=row[4], ISRC=row[5], AlbumArtist=row[6], FilePath=path)
+        self._missed_stats[path] = stat
+        return None
+
+    def put(self, path: str, song: SongMetadata) -> None:
+        stat = self._missed_stats.pop(path, None)
+        if stat is None:
+            try:
+                st = os.stat(path)
+            except OSError:
+                return
+            stat = (st.st_mtime_ns, st.st_size)
+        self._pending.append((path, stat[0], stat[1], song.Artist, song.Title, song.Year,
+                              song.ISRC, song.AlbumArtist))
+        if len(self._pending) >= self.BatchSize:
+            self.flush()
+
+    def flush(self) -> None:
+        """Writes pending entries to the table. Does not commit."""
+        if self._pending:
+            self.connection.executemany("INSERT OR REPLACE INTO metadata_cache VALUES (?,?,?,?,?,?,?,?)", self._pending)
+            self._pending.clear()
+
+
+class ScannedFiles:
+    """Paths that have already been processed, stored in the scanned table of the db.
+    A path is skipped without being read while its modification time and size are unchanged.
+    The table is read once; new entries are written by flush(), which does not commit.
+    """
+
+    def __init__(self, connection: sqlite3.Connection) -> None:
+        self.connection = connection
+        self.connection.execute("CREATE TABLE IF NOT EXISTS scanned (path TEXT PRIMARY KEY, mtime_ns INTEGER, size INTEGER)")
+        self._scanned: dict[str, tuple[int, int]] = {
+            row[0]: (row[1], row[2]) for row in self.connection.execute("SELECT path, mtime_ns, size FROM scanned")}
+        self._pending: list[tuple] = []
+        # (mtime_ns, size) of paths that were not skipped by is_scanned(), reused by add().
+        self._unscanned_stats: dict[str, tuple[int, int]] = {}
+
+    def is_scanned(self, path: str) -> bool:
+        """:returns True if the file was processed before and has not changed since"""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return False
+        stat = (st.st_mtime_ns, st.st_size)
+        if self._scanned.get(path) == stat:
+            return True
+        self._unscanned_stats[path] = stat
+        return False
+
+    def get_stat(self, path: str) -> Optional[tuple[int, int]]:
+        """:returns (mtime_ns, size) of a file is_scanned() returned False for, until it is added"""
+        return self._unscanned_stats.get(path)
+
+    def discard(self, path: str) -> None:
+        """Forgets the stat of a file that won't be added in this run, such as one that failed to be read"""
+        self._unscanned_stats.pop(path, None)
+
+    def add(self, path: str) -> None:
+        """Records that the file has been processed"""
+        stat = self._unscanned_stats.pop(path, None)
+        if stat is None:
+            try:
+                st = os.stat(path)
+            except OSError:
+                return
+            stat = (st.st_mtime_ns, st.st_size)
+        self._scanned[path] = stat
+        self._pending.append((path, stat[0], stat[1]))
+
+    def flush(self) -> None:
+        """Writes pending entries to the table. Does not commit."""
+        if self._pending:
+            self.connection.executemany("INSERT OR REPLACE INTO scanned VALUES (?,?,?)", self._pending)
+            self._pending.clear()
@@ -11,6 +11,27 @@ descriptive error message string that includes the attributes specific to
 that derived class.
 """
 
+import shlex
+import sys
+
+# Bound `str.format` methods of the message templates, so that each `__str__`
+# is a single call with positional arguments.
+_INVALID_ARGUMENT_FMT = "Argument '{0}' received invalid value '{1}': {2}".format
+_OVERRIDE_FILE_FMT = "Command override file-path does not exist: {0}".format
+_EXECUTABLE_FMT = "Command executable was not found in path: {0}".format
+_MEDIA_FILE_FMT = "Media file does not exist locally: {0}".format
+# Shared by the exception classes that wrap another exception.
+_WRAPPED_EXC_FMT = "Function '{0}' raised exception {1} (caught as {2}): {3}".format
+_SUBPROCESS_FMT = "Subprocess {0} returned non-zero exit status {1}: {2}".format
+_STREAM_SUBCLASS_FMT = "{0} is wrong stream subclass for received codec type '{1}' (required codec type is '{2}')".format
+
+# The module name of builtin types (ie, `builtins`).
+_BUILTIN_MODULE = str.__class__.__module__
+
+# Fully-qualified type names returned by `_get_full_qualname`, keyed by type.
+_QUALNAME_CACHE = {}
+
+
 # Base class of exception classes used by this `ffprobe3` package.
 class FFprobeError(Exception):
     """The abstract base class of all exception classes in this package.
@@ -20,9 +41,10 @@ class FFprobeError(Exception):
 
     Every derived class overloads magic method ``__str__`` to return a useful
     descriptive error message string that includes the attributes specific to
-    that derived class.
+    that derived class.  The message is formatted on the first call to
+    ``__str__`` and cached in ``_msg_cache`` for any subsequent calls.
     """
-    pass
+    _msg_cache = None
 
 
 class FFprobeInvalidArgumentError(FFprobeError):
@@ -34,13 +56,15 @@ class FFprobeInvalidArgumentError(FFprobeError):
         value: the invalid value
     """
     def __init__(self, arg_name, problem, value):
-        self.arg_name = arg_name
+        self.arg_name = _intern(arg_name)
         self.problem = problem
         self.value = value
 
     def __str__(self):
-        return "Argument '%s' received invalid value '%s': %s" % \
-                (self.arg_name, self.value, self.problem)
+        if self._msg_cache is None:
+            self._msg_cache = _INVALID_ARGUMENT_FMT(
+                    self.arg_name, self.value, self.problem)
+        return self._msg_cache
 
 
 class FFprobeOverrideFileError(FFprobeError):
@@ -57,8 +81,9 @@ class FFprobeOverrideFileError(FFprobeError):
         self.file_path = file_path
 
     def __str__(self):
-        return "Command override file-path does not exist: %s" % \
-                self.file_path
+        if self._msg_cache is None:
+            self._msg_cache = _OVERRIDE_FILE_FMT(self.file_path)
+        return self._msg_cache
 
 
 class FFprobeExecutableError(FFprobeError):
@@ -75,8 +100,9 @@ class FFprobeExecutableError(FFprobeError):
         self.cmd = cmd
 
     def __str__(self):
-        return "Command executable was not found in path: %s" % \
-                self.cmd
+        if self._msg_cache is None:
+            self._msg_cache = _EXECUTABLE_FMT(self.cmd)
+        return self._msg_cache
 
 
 class FFprobeMediaFileError(FFprobeError):
@@ -89,8 +115,9 @@ class FFprobeMediaFileError(FFprobeError):
         self.file_path = file_path
 
     def __str__(self):
-        return "Media file does not exist locally: %s" % \
-                self.file_path
+        if self._msg_cache is None:
+            self._msg_cache = _MEDIA_FILE_FMT(self.file_path)
+        return self._msg_cache
 
 
 class FFprobePopenError(FFprobeError):
@@ -102,11 +129,15 @@ class FFprobePopenError(FFprobeError):
     """
     def __init__(self, exc, caught_type_name):
         self.exc = exc
-        self.caught_type_name = caught_type_name
+        self.caught_type_name = _intern(caught_type_name)
+        self._exc_qualname = _get_full_qualname(exc)
+        self._exc_msg = str(exc)
 
     def __str__(self):
-        return "Function 'subprocess.Popen' raised exception %s (caught as %s): %s" % \
-                (_get_full_qualname(self.exc), self.caught_type_name, str(self.exc))
+        if self._msg_cache is None:
+            self._msg_cache = _WRAPPED_EXC_FMT('subprocess.Popen',
+                    self._exc_qualname, self.caught_type_name, self._exc_msg)
+        return self._msg_cache
 
 
 class FFprobeJsonParseError(FFprobeError):
@@ -118,11 +149,15 @@ class FFprobeJsonParseError(FFprobeError):
     """
     def __init__(self, exc, caught_type_name):
         self.exc = exc
-        self.caught_type_name = caught_type_name
+        self.caught_type_name = _intern(caught_type_name)
+        self._exc_qualname = _get_full_qualname(exc)
+        self._exc_msg = str(exc)
 
     def __str__(self):
-        return "Function 'json.loads' raised exception %s (caught as %s): %s" % \
-                (_get_full_qualname(self.exc), self.caught_type_name, str(self.exc))
+        if self._msg_cache is None:
+            self._msg_cache = _WRAPPED_EXC_FMT('json.loads',
+                    self._exc_qualname, self.caught_type_name, self._exc_msg)
+        return self._msg_cache
 
 
 class FFprobeSubprocessError(FFprobeError):
@@ -137,10 +172,17 @@ class FFprobeSubprocessError(FFprobeError):
         self.split_cmdline = split_cmdline
         self.exit_status = exit_status
         self.stderr = stderr
+        # Join the command-line once, as a string that can be pasted into a shell.
+        if isinstance(split_cmdline, (list, tuple)):
+            self._cmd_str = shlex.join(map(str, split_cmdline))
+        else:
+            self._cmd_str = str(split_cmdline)
 
     def __str__(self):
-        return "Subprocess %s returned non-zero exit status %s: %s" % \
-                (self.split_cmdline, self.exit_status, self.stderr)
+        if self._msg_cache is None:
+            self._msg_cache = _SUBPROCESS_FMT(
+                    self._cmd_str, self.exit_status, self.stderr)
+        return self._msg_cache
 
 
 class FFprobeStreamSubclassError(FFprobeError):
@@ -152,13 +194,24 @@ class FFprobeStreamSubclassError(FFprobeError):
         required_codec_type (str): the codec-type for the class constructed
     """
     def __init__(self, class_name, received_codec_type, required_codec_type):
-        self.class_name = class_name
-        self.received_codec_type = received_codec_type
-        self.required_codec_type = required_codec_type
+        self.class_name = _intern(class_name)
+        self.received_codec_type = _intern(received_codec_type)
+        self.required_codec_type = _intern(required_codec_type)
 
     def __str__(self):
-        return "%s is wrong stream subclass for received codec type '%s' (required codec type is '%s')" % \
-                (self.class_name, self.received_codec_type, self.required_codec_type)
+        if self._msg_cache is None:
+            self._msg_cache = _STREAM_SUBCLASS_FMT(self.class_name,
+                    self.received_codec_type, self.required_codec_type)
+        return self._msg_cache
+
+
+def _intern(name):
+    """Intern `name` if it's a string (it might also be `None`).
+
+    Names of arguments, classes, codec types & exception types come from a
+    small fixed set, so each distinct name is stored only once.
+    """
+    return sys.intern(name) if type(name) is str else name
 
 
 def _get_full_qualname(obj):
@@ -200,13 +253,23 @@ def _get_full_qualname(obj):
     - `subprocess.SubprocessError`
     - `ValueError`
     - `str`
+
+    The result depends only upon the type of `obj`, so it's cached per type.
     """
-    module = obj.__class__.__module__
+    obj_type = obj.__class__
+    qualname = _QUALNAME_CACHE.get(obj_type)
+    if qualname is not None:
+        return qualname
+
+    module = obj_type.__module__
     # Note: `__module__` can be `None` (according to the docs),
     # and also for a type like `str` it can be `__builtin__`
     #  -- https://stackoverflow.com/a/13653312
-    if module is None or module == str.__class__.__module__:
+    if module is None or module == _BUILTIN_MODULE:
         # Exclude the module name if builtin or `None`,
         # to avoid results like `__builtin__.str`.
-        return obj.__class__.__qualname__
-    return "%s.%s" % (module, obj.__class__.__qualname__)
\ No newline at end of file
+        qualname = obj_type.__qualname__
+    else:
+        qualname = f"{module}.{obj_type.__qualname__}"
+    _QUALNAME_CACHE[obj_type] = qualname
+    return qualname
\ No newline at end of file
@@ -160,18 +160,38 @@ exceptions in the `ffprobe3` class & function API, also look at test module
 `tests/test_ffprobe3.py <https://github.com/jboy/ffprobe3-python3/blob/master/tests/test_ffprobe3.py>`_ (link into GitHub repo).
 """
 
+import hashlib
 import json
+import math
 import os
-import re
+import shutil
+import stat
 import subprocess
+import sys
+import threading
 
-from collections.abc import Mapping
+from collections.abc import Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from .exceptions import *
 
+# Parse ffprobe's JSON output with `orjson` if it's installed (it's several
+# times faster than the standard library), else with `simdjson` (package
+# `pysimdjson`) if that's installed, else fall back to `json.loads`.
+# `orjson.JSONDecodeError` is a subclass of `json.decoder.JSONDecodeError`;
+# `simdjson` reports invalid JSON as a `ValueError`.
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    try:
+        from simdjson import loads as _json_loads
+    except ImportError:
+        _json_loads = json.loads
+
 
-# A list, so you can modify the command-line arguments if you really insist.
+# A tuple, so the split command-line of each probe can be built by a single
+# concatenation.  (You can still replace it, if you really insist.)
 # Don't shoot yourself in the foot!
-_SPLIT_COMMAND_LINE = [
+_SPLIT_COMMAND_LINE = (
         'ffprobe',
         '-v',
         # Use a log-level ('-v') of 'error' rather than 'quiet',
@@ -183,18 +203,38 @@ _SPLIT_COMMAND_LINE = [
         '-show_chapters',
         '-show_format',
         '-show_streams',
-]
+)
 
 # Match anything that looks like a URI Scheme to specify a remote media stream:
 #  https://en.wikipedia.org/wiki/Uniform_Resource_Identifier#Syntax
 #  https://en.wikipedia.org/wiki/List_of_URI_schemes
-_URI_SCHEME = re.compile("^[a-z][a-z0-9-]*://")
+#
+# This is equivalent to the regex "^[a-z][a-z0-9-]*://", but a string scan
+# is cheaper than a regex match (& it's called for every probed file).
+_URI_SCHEME_FIRST_CHARS = 'abcdefghijklmnopqrstuvwxyz'
+_URI_SCHEME_CHARS = _URI_SCHEME_FIRST_CHARS + '0123456789-'
+
+
+# The media filenames with which ``ffprobe`` reads its standard input
+# (which it inherits from this process).
+_STDIN_MEDIA_FILENAMES = frozenset(('-', 'pipe:', 'pipe:0'))
+
+
+def _looks_like_uri(media_filename):
+    """Return whether `media_filename` starts with something like a URI Scheme."""
+    end = media_filename.find('://')
+    return (end > 0
+            and media_filename[0] in _URI_SCHEME_FIRST_CHARS
+            and not media_filename[1:end].lstrip(_URI_SCHEME_CHARS))
 
 
 def probe(media_filename, *,
         communicate_timeout=10.0,  # a timeout in seconds
         ffprobe_cmd_override=None,
-        verify_local_mediafile=True):
+        verify_local_mediafile=True,
+        cache_dir=None,
+        sections=None,
+        ffprobe_threads=0):
     """
     Wrap the ``ffprobe`` command, requesting the ``json`` print-format.
     Parse the JSON output into a hierarchy of :class:`ParsedJson` classes.
@@ -214,6 +254,18 @@ def probe(media_filename, *,
             file-path of a command to invoke instead of default ``"ffprobe"``
         verify_local_mediafile (bool, optional):
             verify `media_filename` exists, if it's a local file (sanity check)
+        cache_dir (str, optional):
+            directory in which to cache the ``ffprobe`` output of local files,
+            keyed by file path, modification time & size (see :func:`clear_cache`)
+        sections (iterable of str, optional):
+            names of the sections for ``ffprobe`` to show (e.g., ``("format",)``
+            when only the size & duration are needed); by default, the
+            ``"chapters"``, ``"format"`` & ``"streams"`` sections
+        ffprobe_threads (int, optional):
+            value for the ``ffprobe -threads`` option: by default ``0``, to
+            let ``ffprobe`` choose according to the CPU count; but e.g. ``1``
+            when many ``ffprobe`` processes are run in parallel, to avoid
+            oversubscribing the CPUs; if ``None``, the option is not passed
 
     Returns:
         a new instance of class :class:`FFprobe`
@@ -221,7 +273,7 @@ def probe(media_filename, *,
     Raises:
         FFprobeError: the base class of all exception classes in this package
         FFprobeExecutableError: ffprobe command not found in ``$PATH``
-        FFprobeInvalidArgumentError: invalid value to `communicate_timeout`
+        FFprobeInvalidArgumentError: invalid value to `communicate_timeout` or `sections`
         FFprobeJsonParseError: JSON parser was unable to parse ffprobe output
         FFprobeMediaFileError: specified local media file does not exist
         FFprobeOverrideFileError: `ffprobe_cmd_override` file not found
@@ -258,16 +310,276 @@ def probe(media_filename, *,
         # or, Remote video stream
         ffprobe_output = ffprobe3.probe('http://some-streaming-url.com:8080/stream')
     """
+    (split_cmdline, parsed_json) = _run_ffprobe(media_filename,
+            communicate_timeout=communicate_timeout,
+            ffprobe_cmd_override=ffprobe_cmd_override,
+            verify_local_mediafile=verify_local_mediafile,
+            cache_dir=cache_dir,
+            sections=sections,
+            ffprobe_threads=ffprobe_threads)
+    return FFprobe._from_trusted(split_cmdline, parsed_json)
+
+
+def probe_json(media_filename, *,
+        communicate_timeout=10.0,  # a timeout in seconds
+        ffprobe_cmd_override=None,
+        verify_local_mediafile=True,
+        show_entries=None,
+        ffprobe_threads=0,
+        cache_dir=None,
+        sections=None):
+    """
+    Wrap the ``ffprobe`` command like :func:`probe`, but return the parsed
+    JSON output as a plain ``dict`` instead of an instance of :class:`FFprobe`.
+
+    This skips constructing the hierarchy of :class:`ParsedJson` classes
+    (format, every stream, every chapter), which is wasted work for client
+    code that only reads a few keys, such as the tags of one stream.
+
+    Accepts the same arguments, and raises the same exceptions, as
+    function :func:`probe`, plus:
+
+    Args:
+        show_entries (str, optional):
+            an ``ffprobe -show_entries`` specifier (e.g.,
+            ``"stream=codec_type:stream_tags"``) to request only those
+            entries, instead of the whole chapters, format & streams sections
+            (or in addition to the whole `sections`, if those are specified)
+
+    Restricting the output to the entries that will actually be read reduces
+    the work done by ``ffprobe`` and the size of the JSON to be parsed.
+
+    Returns:
+        ``dict`` of parsed JSON output from the ``ffprobe`` command
+    """
+    return _run_ffprobe(media_filename,
+            communicate_timeout=communicate_timeout,
+            ffprobe_cmd_override=ffprobe_cmd_override,
+            verify_local_mediafile=verify_local_mediafile,
+            show_entries=show_entries,
+            ffprobe_threads=ffprobe_threads,
+            cache_dir=cache_dir,
+            sections=sections)[1]
 
-    split_cmdline = list(_SPLIT_COMMAND_LINE)  # Roger, copy that.
-    ffprobe_cmd = split_cmdline[0]
+
+def probe_many(media_filenames, *, max_workers=None, **probe_kwargs):
+    """
+    Call :func:`probe` for each of `media_filenames`, running up to
+    `max_workers` ``ffprobe`` subprocesses concurrently.
+
+    Args:
+        media_filenames (iterable of str):
+            filenames of local media or URIs of remote media to probe
+        max_workers (positive int, optional):
+            maximum number of concurrent ``ffprobe`` subprocesses
+            (if ``None``, the default of ``concurrent.futures.ThreadPoolExecutor``)
+        probe_kwargs:
+            keyword arguments passed through to each call of :func:`probe`
+
+    Returns:
+        ``list`` with one element per media filename, in the same order:
+        either a new instance of class :class:`FFprobe`, or the exception
+        (some derived class of :class:`ffprobe3.exceptions.FFprobeError`)
+        that was raised when probing that media
+
+    The work of each call is done in its ``ffprobe`` subprocess, so threads
+    (rather than processes) are sufficient to keep all the CPUs busy, and the
+    resulting instances of :class:`FFprobe` don't need to be pickled.
+    """
+    def probe_or_error(media_filename):
+        try:
+            return probe(media_filename, **probe_kwargs)
+        except FFprobeError as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(probe_or_error, media_filenames))
+
+
+def clear_cache(cache_dir):
+    """
+    Delete all the cached ``ffprobe`` output in directory `cache_dir`
+    (as written by :func:`probe` with argument `cache_dir`).
+
+    Only the files named by the cache (a SHA-1 hex digest with suffix
+    ``.json``) are deleted, along with any temporary files left behind by
+    interrupted writes to the cache.  Other files in `cache_dir` are kept.
+
+    Args:
+        cache_dir (str):
+            the directory that was passed as `cache_dir` to :func:`probe`
+
+    Returns:
+        the number of cache files that were deleted
+    """
+    num_deleted = 0
+    try:
+        entries = os.scandir(cache_dir)
+    except FileNotFoundError:
+        return num_deleted
+    with entries:
+        for entry in entries:
+            if _is_cache_file_name(entry.name) and entry.is_file():
+                try:
+                    os.remove(entry.path)
+                    num_deleted += 1
+                except FileNotFoundError:
+                    pass
+    return num_deleted
+
+
+_CACHE_SUFFIX = '.json'
+# Each cache file is first written to a temporary file with this suffix
+# (followed by the process & thread IDs), then renamed.
+_CACHE_TMP_SUFFIX = _CACHE_SUFFIX + '.tmp.'
+# The number of hex digits in a SHA-1 digest, which names each cache file.
+_CACHE_DIGEST_LEN = 40
+_HEX_DIGITS = frozenset('0123456789abcdef')
+
+
+def _is_cache_file_name(name):
+    """Return whether `name` is a cache file (or temporary cache file) name."""
+    digest = name[:_CACHE_DIGEST_LEN]
+    if len(digest) != _CACHE_DIGEST_LEN or not _HEX_DIGITS.issuperset(digest):
+        return False
+    suffix = name[_CACHE_DIGEST_LEN:]
+    return (suffix == _CACHE_SUFFIX or suffix.startswith(_CACHE_TMP_SUFFIX))
+
+
+def _stat_or_none(file_path):
+    """Return ``os.stat(file_path)``; else ``None`` if that fails."""
+    try:
+        return os.stat(file_path)
+    except (OSError, ValueError):
+        return None
+
+
+def _get_cache_path(cache_dir, split_cmdline, media_filename, media_stat):
+    """Return the cache file-path for the ``ffprobe`` output of a local file.
+
+    The key includes the modification time & size of the media file (from
+    `media_stat`), so an edited media file is probed again; and the
+    command-line, so output requested with different arguments (e.g.,
+    ``-show_entries``) is kept separately.
+    """
+    key = '\0'.join((*split_cmdline[:-1], os.path.abspath(media_filename),
+            str(media_stat.st_mtime_ns), str(media_stat.st_size)))
+    digest = hashlib.sha1(key.encode('utf-8', errors='surrogateescape')).hexdigest()
+    return os.path.join(cache_dir, digest + _CACHE_SUFFIX)
+
+
+def _read_cache(cache_path):
+    """Return the parsed JSON cached at `cache_path`, or ``None`` on a miss.
+
+    A missing, unreadable or corrupt cache file is treated as a miss.
+    """
+    try:
+        with open(cache_path, 'rb') as f:
+            return _json_loads(f.read())
+    except (OSError, ValueError):
+        return None
+
+
+def _write_cache(cache_path, outs):
+    """Atomically write the ``ffprobe`` output `outs` to `cache_path`.
+
+    The cache is only an optimization, so failure to write it is ignored.
+
+    The temporary file is named by both the process & the thread, so threads
+    that probe the same media file concurrently don't write the same file.
+    """
+    tmp_path = '%s.tmp.%d.%d' % (cache_path, os.getpid(), threading.get_ident())
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(tmp_path, 'wb') as f:
+            f.write(outs)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+# The ``ffprobe`` option to show each section that may be requested.
+_SHOW_SECTION_ARGS = {
+        section: '-show_' + section
+        for section in ('chapters', 'error', 'format', 'frames', 'packets',
+                'programs', 'streams')
+}
+
+
+def _get_show_section_args(sections):
+    """Return a tuple of the ``ffprobe`` options to show `sections`."""
+    if isinstance(sections, str):
+        raise FFprobeInvalidArgumentError('sections',
+                'Supplied sections is a string rather than an iterable of strings',
+                sections)
+    try:
+        return tuple(_SHOW_SECTION_ARGS[section] for section in sections)
+    except (KeyError, TypeError) as e:
+        raise FFprobeInvalidArgumentError('sections',
+                'Supplied sections is not an iterable of known section names',
+                sections) from e
+
+
+# The absolute paths of ffprobe commands that have been found in `$PATH`.
+_RESOLVED_FFPROBE_CMDS = {}
+
+
+def _resolve_ffprobe_cmd(ffprobe_cmd):
+    """Return the absolute path of `ffprobe_cmd` found in `$PATH`; else ``None``.
+
+    A successful look-up is remembered, so `$PATH` is searched only once;
+    a failed look-up is not, in case the command is installed later.
+    """
+    ffprobe_path = _RESOLVED_FFPROBE_CMDS.get(ffprobe_cmd)
+    if ffprobe_path is None:
+        ffprobe_path = shutil.which(ffprobe_cmd)
+        if ffprobe_path is not None:
+            _RESOLVED_FFPROBE_CMDS[ffprobe_cmd] = ffprobe_path
+    return ffprobe_path
+
+
+def _run_ffprobe(media_filename, *,
+        communicate_timeout,
+        ffprobe_cmd_override,
+        verify_local_mediafile,
+        show_entries=None,
+        ffprobe_threads=None,
+        cache_dir=None,
+        sections=None):
+    """Run the ``ffprobe`` command & parse its JSON output.
+
+    Returns:
+        2-tuple of (split command-line that was executed, parsed JSON)
+    """
+    ffprobe_cmd = _SPLIT_COMMAND_LINE[0]
+    cmdline_args = _SPLIT_COMMAND_LINE[1:]
+    if sections is not None or show_entries is not None:
+        # Replace the default whole-section arguments with the requested
+        # sections &/or entries.
+        cmdline_args = tuple(arg for arg in cmdline_args
+                if not arg.startswith('-show_'))
+        if sections is not None:
+            cmdline_args += _get_show_section_args(sections)
+        if show_entries is not None:
+            cmdline_args += ('-show_entries', show_entries)
+    if ffprobe_threads is not None:
+        cmdline_args += ('-threads', str(ffprobe_threads))
 
     if ffprobe_cmd_override is not None:
         if not os.path.isfile(ffprobe_cmd_override):
             raise FFprobeOverrideFileError(ffprobe_cmd_override)
         else:
             ffprobe_cmd = ffprobe_cmd_override
-            split_cmdline[0] = ffprobe_cmd_override
+            ffprobe_path = ffprobe_cmd_override
+    else:
+        # Pass the absolute path to `Popen`, so it isn't looked-up in `$PATH`
+        # again for every probed file.
+        ffprobe_path = _resolve_ffprobe_cmd(ffprobe_cmd)
+        if ffprobe_path is None:
+            raise FFprobeExecutableError(ffprobe_cmd)
 
     if communicate_timeout is not None:
         # Verify that this non-None value is some kind of positive number.
@@ -300,6 +612,14 @@ def probe(media_filename, *,
     # (e.g., over HTTP)...  The previous version of `ffprobe-python` did that,
     # and it was reported as an issue (which is still Open):
     #  https://github.com/gbstack/ffprobe-python/issues/4
+    # Neither a remote media file nor standard input can be stat'ed.
+    is_local_mediafile = (media_filename not in _STDIN_MEDIA_FILENAMES
+            and not _looks_like_uri(media_filename))
+    media_stat = None
+    if is_local_mediafile and (verify_local_mediafile or cache_dir is not None):
+        # A single `stat` of a local media file serves both the sanity check
+        # & the cache key.
+        media_stat = _stat_or_none(media_filename)
     if verify_local_mediafile:
         # How do we detect when the media file is remote rather than local?
         # If you run `ffprobe -protocols`, it prints the file protocols that
@@ -313,9 +633,9 @@ def probe(media_filename, *,
         # anything that *looks* like a URI Scheme:
         #  https://en.wikipedia.org/wiki/Uniform_Resource_Identifier#Syntax
         #  https://en.wikipedia.org/wiki/List_of_URI_schemes
-        if _URI_SCHEME.match(media_filename) is None:
+        if is_local_mediafile:
             # It doesn't look like the URI of a remote media file.
-            if not os.path.isfile(media_filename):
+            if media_stat is None or not stat.S_ISREG(media_stat.st_mode):
                 raise FFprobeMediaFileError(media_filename)
 
     # NOTE #1: Python3 docs say that its `Popen` does not call a system shell:
@@ -335,14 +655,25 @@ def probe(media_filename, *,
     #  https://docs.python.org/3/library/subprocess.html#converting-argument-sequence
     #
     # But I don't use Windows, so I can't test anything, sorry...
-    split_cmdline.append(media_filename)
+    split_cmdline = (ffprobe_path, *cmdline_args, media_filename)
+
+    cache_path = None
+    if cache_dir is not None and media_stat is not None:
+        cache_path = _get_cache_path(cache_dir, split_cmdline,
+                media_filename, media_stat)
+        parsed_json = _read_cache(cache_path)
+        if parsed_json is not None:
+            return (split_cmdline, parsed_json)
 
     try:
         # https://docs.python.org/3/library/subprocess.html#subprocess.Popen
+        #
+        # The default `close_fds=True` is kept, so that no inheritable file
+        # descriptor of the calling program leaks into `ffprobe`.  (Since
+        # Python 3.10, CPython spawns the child with `vfork` on Linux anyway.)
         proc = subprocess.Popen(split_cmdline,
                 stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                universal_newlines=True)
+                stderr=subprocess.PIPE)
     # We catch the following plausible exceptions specifically,
     # in case we decide that we want to process any of them specially.
     except FileNotFoundError as e:
@@ -409,8 +740,19 @@ def probe(media_filename, *,
     except subprocess.TimeoutExpired:
         proc.kill()
         (outs, errs) = proc.communicate()
-    # Because we specified `universal_newlines=True` to `subprocess.Popen`,
-    # `outs` & `errs` are text strings.
+    # Because we did not specify `universal_newlines=True` (text mode) to
+    # `subprocess.Popen`, `outs` & `errs` are bytes.  The JSON parsers accept
+    # bytes directly (and detect the UTF encoding themselves), so the JSON
+    # output is never decoded into an intermediate text string.
+    #
+    # NOTE #5: We parse the JSON output in one piece, after `ffprobe` exits,
+    # rather than feeding chunks of `proc.stdout` to an incremental parser.
+    # `ffprobe` prints its JSON only after it has finished probing, so there
+    # is no probing work to overlap with parsing; `Popen.communicate` already
+    # multiplexes stdout & stderr (so neither pipe can block `ffprobe`); and
+    # the caller receives the whole parsed JSON anyway, so the peak memory
+    # can't drop below the size of the parsed result.  The one-shot parsers
+    # (`orjson` & `simdjson`) are also much faster than incremental ones.
     #
     # XXX: I'm using `Popen.communicate`; so this function will close the
     # pipes for me automatically, right?  Because `Popen.communicate` waits
@@ -428,18 +770,64 @@ def probe(media_filename, *,
     #   child process and finish communication:
     #   '''
     try:
-        parsed_json = json.loads(outs)
+        parsed_json = _json_loads(outs)
     except json.decoder.JSONDecodeError as e:
         raise FFprobeJsonParseError(e, 'json.decoder.JSONDecodeError') from e
+    except ValueError as e:
+        raise FFprobeJsonParseError(e, 'ValueError') from e
     exit_status = proc.returncode
     if exit_status != 0:
-        raise FFprobeSubprocessError(split_cmdline, exit_status, errs)
+        raise FFprobeSubprocessError(split_cmdline, exit_status,
+                errs.decode('utf-8', errors='replace'))
+
+    if cache_path is not None:
+        _write_cache(cache_path, outs)
+    return (split_cmdline, parsed_json)
+
+
+# Sentinels for the memo of converted values in class `ParsedJson`.
+_NOT_CONVERTED = object()
+_CONVERSION_FAILED = object()
 
-    return FFprobe(split_cmdline=split_cmdline, parsed_json=parsed_json)
+
+# Unit prefixes & their divisors for `ParsedJson.get_datasize_as_human`.
+_DATASIZE_UNITS_10 = ('', 'k', 'M', 'G', 'T', 'P', 'E', 'Z', 'Y')
+_DATASIZE_UNITS_2 = ('',) + tuple(unit + 'i' for unit in _DATASIZE_UNITS_10[1:])
+_DATASIZE_DIVISORS_10 = tuple(1000.0 ** i for i in range(len(_DATASIZE_UNITS_10)))
+_DATASIZE_DIVISORS_2 = tuple(1024.0 ** i for i in range(len(_DATASIZE_UNITS_2)))
+_DATASIZE_MAX_IDX = len(_DATASIZE_UNITS_10) - 1
+
+
+def _intern_str(value):
+    """Return `value` interned, if it's a ``str``; else `value` unchanged.
+
+    The dictionary keys in the source code are already interned by the
+    compiler; interning frequently-repeated *values* (such as codec types)
+    shares one copy between all the streams, and lets comparisons with the
+    interned literals succeed by identity.
+    """
+    if type(value) is str:
+        return sys.intern(value)
+    return value
+
+
+def _is_int_token(token):
+    """Return whether string `token` looks like an ``int``: ``-?[0-9]+``"""
+    digits = token[1:] if token.startswith('-') else token
+    return digits.isdigit() and digits.isascii()
+
+
+def _is_attr_name(attr_name):
+    """Return whether `attr_name` is listed by `ParsedJson.list_attr_names`."""
+    return not (attr_name.startswith(("_", "get", "is_", "list_")) or
+            attr_name in ("keys", "items", "values"))
 
 
 class ParsedJson(Mapping):
 
+    # No per-instance `__dict__`: there may be very many of these instances.
+    __slots__ = ('parsed_json', '_conv_cache')
+
     def __init__(self, parsed_json):
         """Construct a wrapper that references the ``dict``-like `parsed_json`.
 
@@ -457,6 +845,9 @@ class ParsedJson(Mapping):
                     parsed_json)
 
         self.parsed_json = parsed_json
+        # Memo of `(key, type)` -> value converted by `get_as_float`
+        # & `get_as_int`, so that repeated accesses convert only once.
+        self._conv_cache = {}
 
     def __contains__(self, key):
         """Return whether `key` in parsed JSON.
@@ -500,7 +891,7 @@ class ParsedJson(Mapping):
         `abstract Mapping <https://docs.python.org/3/library/collections.abc.html#collections-abstract-base-classes>`_
         interface.
         """
-        yield from self.parsed_json
+        return iter(self.parsed_json)
 
     def __len__(self):
         """Return the count of keys in parsed JSON.
@@ -515,8 +906,7 @@ class ParsedJson(Mapping):
         return len(self.parsed_json)
 
     def __repr__(self):
-        return '%s(parsed_json=%s)' % \
-                (type(self).__qualname__, repr(self.parsed_json))
+        return f'{self._NAME}(parsed_json={self.parsed_json!r})'
 
     def get(self, key, default=None):
         """Return the value for `key`, if `key` in parsed JSON; else `default`.
@@ -542,10 +932,27 @@ class ParsedJson(Mapping):
 
         This method will never raise an exception.
         """
-        try:
-            return float(self.parsed_json[key])
-        except Exception as e:
+        return self._get_converted(key, float, default)
+
+    def get_as_float_scaled(self, key, divisor, default=None):
+        """Return the value for `key` as a ``float`` divided by `divisor`,
+        if `key` is in parsed JSON and can be converted to a ``float``;
+        else `default`.
+
+        Returns:
+            ``float`` or `default`
+
+        This is useful to convert units (e.g., from bits-per-second to
+        kilobits-per-second).  If `key` is not found in parsed JSON, or if
+        conversion to ``float`` fails, default to `default`.
+        If `default` is not supplied, default to ``None``.
+
+        This method will never raise an exception (unless `divisor` is zero).
+        """
+        value = self._get_converted(key, float, _CONVERSION_FAILED)
+        if value is _CONVERSION_FAILED:
             return default
+        return value / divisor
 
     def get_as_int(self, key, default=None):
         """Return the value for `key` as an ``int``, if `key` is in parsed JSON
@@ -561,10 +968,25 @@ class ParsedJson(Mapping):
 
         This method will never raise an exception.
         """
-        try:
-            return int(self.parsed_json[key])
-        except Exception as e:
+        return self._get_converted(key, int, default)
+
+    def _get_converted(self, key, conv_type, default):
+        """Return the value for `key` converted by `conv_type`; else `default`.
+
+        The result of the conversion (or of its failure) is memoized
+        per instance, so the parsed JSON must not be modified afterwards.
+        """
+        cache_key = (key, conv_type)
+        value = self._conv_cache.get(cache_key, _NOT_CONVERTED)
+        if value is _NOT_CONVERTED:
+            try:
+                value = conv_type(self.parsed_json[key])
+            except Exception as e:
+                value = _CONVERSION_FAILED
+            self._conv_cache[cache_key] = value
+        if value is _CONVERSION_FAILED:
             return default
+        return value
 
     def get_datasize_as_human(self, key, default=None, *,
             suffix='', use_base_10=True):
@@ -593,29 +1015,35 @@ class ParsedJson(Mapping):
         if use_base_10:
             # This is the default, because it's what `ls -lh` does.
             divisor = 1000.0
+            divisors = _DATASIZE_DIVISORS_10
+            units = _DATASIZE_UNITS_10
         else:
             # Use base 2 instead.
+            # The non-empty units are postfixed by 'i' (e.g., 'ki', 'Mi', etc.).
             divisor = 1024.0
+            divisors = _DATASIZE_DIVISORS_2
+            units = _DATASIZE_UNITS_2
 
         try:
             num = float(self.parsed_json[key])
-            for unit in ['', 'k', 'M', 'G', 'T', 'P', 'E', 'Z']:
-                if abs(num) < divisor:
-                    if unit and not use_base_10:
-                        # We're not using base 10; it must be base 2 instead.
-                        # And there is a non-empty unit (e.g., 'k', 'M', etc.).
-                        # So, postfix the unit by 'i' (e.g., 'ki', 'Mi', etc.).
-                        return "%3.1f %si%s" % (num, unit, suffix)
-                    return "%3.1f %s%s" % (num, unit, suffix)
-                num /= divisor
-            # The number is large enough that we've reached "Yotta-" ('Y'),
-            # the largest decimal unit prefix in the metric system:
+            abs_num = abs(num)
+            if not math.isfinite(abs_num):
+                # Infinity & NaN can't be scaled down to any smaller unit.
+                idx = _DATASIZE_MAX_IDX
+            elif abs_num < divisor:
+                idx = 0
+            else:
+                # Estimate the unit index from the logarithm, then correct
+                # for any floating-point rounding error in the estimate.
+                idx = min(int(math.log(abs_num, divisor)), _DATASIZE_MAX_IDX)
+                if idx < _DATASIZE_MAX_IDX and abs_num / divisors[idx] >= divisor:
+                    idx += 1
+                elif abs_num / divisors[idx] < 1.0:
+                    idx -= 1
+            # The largest unit is "Yotta-" ('Y'), the largest decimal unit
+            # prefix in the metric system:
             #  https://en.wikipedia.org/wiki/Yotta-
-            if not use_base_10:
-                # We're not using base 10; it must be base 2 instead.
-                # So, postfix the unit by 'i' (ie, 'Yi').
-                return "%.1f %s%s" % (num, 'Yi', suffix)
-            return "%.1f %s%s" % (num, 'Y', suffix)
+            return f"{num / divisors[idx]:.1f} {units[idx]}{suffix}"
         except Exception as e:
             return default
 
@@ -636,31 +1064,57 @@ class ParsedJson(Mapping):
             # Only the seconds
             duration_secs = float(self.parsed_json["duration"])
             # Minutes, seconds
-            duration_mins = duration_secs // 60
-            duration_secs -= duration_mins * 60
+            duration_mins, duration_secs = divmod(duration_secs, 60.0)
             # Hours, minutes, seconds
-            duration_hours = duration_mins // 60
-            duration_mins -= duration_hours * 60
-            return "%02d:%02d:%05.2f" % \
-                    (int(duration_hours), int(duration_mins), duration_secs)
+            duration_hours, duration_mins = divmod(duration_mins, 60.0)
+            return f"{int(duration_hours):02d}:{int(duration_mins):02d}:{duration_secs:05.2f}"
         except Exception as e:
             return default
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._init_names()
+
+    @classmethod
+    def _init_names(cls):
+        """Precompute the class name, and the attribute & getter names,
+        of class `cls`, so they aren't recomputed on every call."""
+        cls._NAME = cls.__qualname__
+        names = dir(cls)
+        cls._attr_names = tuple(attr_name for attr_name in names
+                if _is_attr_name(attr_name))
+        cls._getter_names = tuple(attr_name for attr_name in names
+                if attr_name.startswith("get"))
+
     def list_attr_names(self):
-        return [attr_name for attr_name in dir(self)
-                if not (attr_name.startswith("_") or
-                        attr_name.startswith("get") or
-                        attr_name.startswith("is_") or
-                        attr_name.startswith("list_") or
-                        attr_name in ("keys", "items", "values"))]
+        instance_names = getattr(self, "__dict__", None)
+        if not instance_names:
+            return list(self._attr_names)
+        # Merge the data attributes of this instance, in sorted order
+        # (as ``dir(self)`` would).
+        return sorted(set(self._attr_names).union(
+                attr_name for attr_name in instance_names
+                if _is_attr_name(attr_name)))
 
     def list_getter_names(self):
-        return [attr_name for attr_name in dir(self)
-                if attr_name.startswith("get")]
+        return list(self._getter_names)
+
+    # These methods would be provided by the `Mapping` mixin, but its views
+    # look-up every value through `__getitem__`; so delegate directly to the
+    # ``dict`` views of parsed JSON instead.
 
     def keys(self):
         return self.parsed_json.keys()
 
+    def items(self):
+        return self.parsed_json.items()
+
+    def values(self):
+        return self.parsed_json.values()
+
+
+ParsedJson._init_names()
+
 
 class FFprobe(ParsedJson):
     """
@@ -695,7 +1149,7 @@ class FFprobe(ParsedJson):
     The following data attributes enable retrospective review of the command
     that was executed to produce this parsed probe output:
 
-    :ivar split_cmdline: (list of ``str``) split command-line that was executed
+    :ivar split_cmdline: (sequence of ``str``) split command-line that was executed
     :ivar executed_cmd: (``str``) command executable filename that was executed
     :ivar media_filename: (``str``) media filename that was probed
 
@@ -714,6 +1168,10 @@ class FFprobe(ParsedJson):
     Raises:
         FFprobeInvalidArgumentError: invalid value supplied for function argument
     """
+    __slots__ = ('split_cmdline', 'executed_cmd', 'media_filename',
+            'format', 'streams', 'chapters',
+            '_attachment', '_audio', '_subtitle', '_video')
+
     def __init__(self, *, split_cmdline=[], parsed_json={}):
         # Verify that `split_cmdline` is a non-string sequence that contains
         # at least 2 strings (ie, the command name & the media file name).
@@ -722,60 +1180,112 @@ class FFprobe(ParsedJson):
             raise FFprobeInvalidArgumentError('split_cmdline',
                     'Supplied split command-line is actually a single string',
                     split_cmdline)
-
-        try:
-            if len(split_cmdline) < 2:
-                raise FFprobeInvalidArgumentError('split_cmdline',
-                        'Supplied split command-line has too few elements',
-                        split_cmdline)
-        except (AttributeError, TypeError, ValueError) as e:
+        # Check the usual types first, before the slower ABC check.
+        if not isinstance(split_cmdline, (list, tuple, Sequence)):
             raise FFprobeInvalidArgumentError('split_cmdline',
                     'Supplied split command-line is not a sequence',
-                    split_cmdline) from e
-
-        try:
-            for s in split_cmdline:
-                if not isinstance(s, str):
-                    raise FFprobeInvalidArgumentError('split_cmdline',
-                            'Supplied split command-line contains non-strings',
-                            split_cmdline)
-        except (AttributeError, TypeError, ValueError) as e:
+                    split_cmdline)
+        if len(split_cmdline) < 2:
             raise FFprobeInvalidArgumentError('split_cmdline',
-                    'Supplied split command-line is not a sequence',
-                    split_cmdline) from e
+                    'Supplied split command-line has too few elements',
+                    split_cmdline)
+        for s in split_cmdline:
+            if not isinstance(s, str):
+                raise FFprobeInvalidArgumentError('split_cmdline',
+                        'Supplied split command-line contains non-strings',
+                        split_cmdline)
+
+        self._init_validated(split_cmdline, parsed_json)
+
+    @classmethod
+    def _from_trusted(cls, split_cmdline, parsed_json):
+        """Construct an instance without verifying `split_cmdline`,
+        for function :func:`probe`, which built the command-line itself."""
+        assert type(split_cmdline) is tuple and len(split_cmdline) >= 2
+        self = cls.__new__(cls)
+        self._init_validated(split_cmdline, parsed_json)
+        return self
 
+    def _init_validated(self, split_cmdline, parsed_json):
         self.split_cmdline = split_cmdline
         self.executed_cmd = split_cmdline[0]
         self.media_filename = split_cmdline[-1]
 
         super().__init__(parsed_json)
         # Pick out some particular expected keys from the parsed JSON.
-        self.format = FFformat(self.get("format", {}))
-        self.streams = [_construct_ffstream_subclass(stream)
-                for stream in self.get("streams", [])]
-        self.chapters = [FFchapter(chapter)
-                for chapter in self.get("chapters", [])]
-
-        self.attachment =   [s for s in self.streams if s.is_attachment()]
-        self.audio =        [s for s in self.streams if s.is_audio()]
-        self.subtitle =     [s for s in self.streams if s.is_subtitle()]
-        self.video =        [s for s in self.streams if s.is_video()]
+        # (In the constructors, we look-up keys in the parsed JSON directly,
+        # rather than through the method `self.get`.)
+        self.format = FFformat(parsed_json.get("format", {}))
+        streams_json = parsed_json.get("streams")
+        self.streams = (list(map(_construct_ffstream_subclass, streams_json))
+                if streams_json else [])
+        chapters_json = parsed_json.get("chapters")
+        self.chapters = (list(map(FFchapter, chapters_json))
+                if chapters_json else [])
+
+        # The streams are sorted by codec type on first access (if any).
+        self._attachment = None
+        self._audio = None
+        self._subtitle = None
+        self._video = None
+
+    @property
+    def attachment(self):
+        """(list of :class:`FFattachmentStream`) only parsed attachment streams"""
+        if self._attachment is None:
+            self._sort_streams_by_codec_type()
+        return self._attachment
+
+    @property
+    def audio(self):
+        """(list of :class:`FFaudioStream`) only parsed audio streams"""
+        if self._audio is None:
+            self._sort_streams_by_codec_type()
+        return self._audio
+
+    @property
+    def subtitle(self):
+        """(list of :class:`FFsubtitleStream`) only parsed subtitle streams"""
+        if self._subtitle is None:
+            self._sort_streams_by_codec_type()
+        return self._subtitle
+
+    @property
+    def video(self):
+        """(list of :class:`FFvideoStream`) only parsed video streams"""
+        if self._video is None:
+            self._sort_streams_by_codec_type()
+        return self._video
+
+    def _sort_streams_by_codec_type(self):
+        """Sort the streams into the lists for each codec type, in one pass."""
+        self._attachment =  []
+        self._audio =       []
+        self._subtitle =    []
+        self._video =       []
+        streams_by_codec_type = {
+                'attachment':   self._attachment,
+                'audio':        self._audio,
+                'subtitle':     self._subtitle,
+                'video':        self._video,
+        }
+        for stream in self.streams:
+            same_type_streams = streams_by_codec_type.get(stream.codec_type)
+            if same_type_streams is not None:
+                same_type_streams.append(stream)
 
     def __repr__(self):
         """Return a string that would yield an object with the same value."""
-        return '%s(split_cmdline=%s, parsed_json=%s)' % \
-                (type(self).__qualname__, self.split_cmdline, self.parsed_json)
+        return (f'{self._NAME}(split_cmdline={self.split_cmdline}, '
+                f'parsed_json={self.parsed_json})')
 
     def __str__(self):
         """Return a string containing a human-readable summary of the object."""
-        return '%s(%s "%s" => (%s): %s, %s, %s kb/s, %d streams, %d chapters)' % \
-                (type(self).__qualname__,
-                        self.executed_cmd, self.media_filename,
-                        self.format.format_name,
-                        self.format.duration_human,
-                        self.format.size_human,
-                        self.format.bit_rate_kbps,
-                        len(self.streams), len(self.chapters))
+        fmt = self.format
+        return (f'{self._NAME}({self.executed_cmd} "{self.media_filename}" => '
+                f'({fmt.format_name}): {fmt.duration_human}, {fmt.size_human}, '
+                f'{fmt.bit_rate_kbps} kb/s, '
+                f'{len(self.streams):d} streams, {len(self.chapters):d} chapters)')
 
 
 class FFformat(ParsedJson):
@@ -812,27 +1322,26 @@ class FFformat(ParsedJson):
     It is constructed by function :func:`probe`.  But client code *will* want
     to examine the attributes of a returned instance of this class.
     """
+    __slots__ = ('format_name', 'format_long_name',
+            'duration_secs', 'duration_human', 'num_streams',
+            'bit_rate_bps', 'bit_rate_kbps', 'size_B', 'size_human')
+
     def __init__(self, parsed_json):
         super().__init__(parsed_json)
-        self.format_name =          self.get('format_name')
-        self.format_long_name =     self.get('format_long_name')
+        self.format_name =          parsed_json.get('format_name')
+        self.format_long_name =     parsed_json.get('format_long_name')
         self.duration_secs =        self.get_as_float('duration')
         self.duration_human =       self.get_duration_as_human()
         self.num_streams =          self.get_as_int('nb_streams')
         self.bit_rate_bps =         self.get_as_int('bit_rate')
-        try:
-            self.bit_rate_kbps = float(self.bit_rate_bps) / 1000.0
-        except (TypeError, ValueError):
-            self.bit_rate_kbps = None
+        self.bit_rate_kbps = self.get_as_float_scaled('bit_rate', 1000.0)
         self.size_B =               self.get_as_int('size')
         self.size_human =           self.get_datasize_as_human('size', suffix='B')
 
     def __str__(self):
         """Return a string containing a human-readable summary of the object."""
-        return '%s((%s): %s, %s, %s kb/s)' % \
-                (type(self).__qualname__, self.format_name,
-                        self.duration_human, self.size_human,
-                        self.bit_rate_kbps)
+        return (f'{self._NAME}(({self.format_name}): {self.duration_human}, '
+                f'{self.size_human}, {self.bit_rate_kbps} kb/s)')
 
 
 class FFchapter(ParsedJson):
@@ -862,21 +1371,20 @@ class FFchapter(ParsedJson):
     It is constructed by function :func:`probe`.  But client code *will* want
     to examine the attributes of a returned instance of this class.
     """
+    __slots__ = ('id', 'title')
+
     def __init__(self, parsed_json):
         super().__init__(parsed_json)
-        self.id = self.get('id')
+        self.id = parsed_json.get('id')
         # This JSON might not have a "tags" key; or the value of the "tags" key
         # might not be a nested dictionary; or that nested dictionary might not
         # have a "title" key.
-        try:
-            self.title = self['tags']['title']
-        except Exception as e:
-            self.title = None
+        tags = parsed_json.get('tags')
+        self.title = tags.get('title') if isinstance(tags, Mapping) else None
 
     def __str__(self):
         """Return a string containing a human-readable summary of the object."""
-        return '%s(chapters[%s]: "%s")' % \
-                (type(self).__qualname__, self.id, self.title)
+        return f'{self._NAME}(chapters[{self.id}]: "{self.title}")'
 
 
 class FFstream(ParsedJson):
@@ -923,35 +1431,44 @@ class FFstream(ParsedJson):
     It is constructed by function :func:`probe`.  But client code *will* want
     to examine the attributes of a returned instance of this class.
     """
+    __slots__ = ('index', 'codec_type', 'codec_name', 'codec_long_name',
+            'duration_secs',
+            '_is_attachment', '_is_audio', '_is_subtitle', '_is_video')
+
     def __init__(self, parsed_json):
         super().__init__(parsed_json)
-        self.index =            self.get('index')
-        self.codec_type =       self.get('codec_type')
-        self.codec_name =       self.get('codec_name')
-        self.codec_long_name =  self.get('codec_long_name')
+        self.index =            parsed_json.get('index')
+        self.codec_type =       _intern_str(parsed_json.get('codec_type'))
+        self.codec_name =       _intern_str(parsed_json.get('codec_name'))
+        self.codec_long_name =  parsed_json.get('codec_long_name')
         self.duration_secs =    self.get_as_float('duration')
+        # Classify the codec type once, for the `is_*` methods.
+        codec_type = self.codec_type
+        self._is_attachment =   (codec_type == 'attachment')
+        self._is_audio =        (codec_type == 'audio')
+        self._is_subtitle =     (codec_type == 'subtitle')
+        self._is_video =        (codec_type == 'video')
 
     def __str__(self):
         """Return a string containing a human-readable summary of the object."""
-        return '%s(streams[%s]: %s(%s))' % \
-                (type(self).__qualname__, self.index,
-                        self.codec_type, self.codec_name)
+        return (f'{self._NAME}(streams[{self.index}]: '
+                f'{self.codec_type}({self.codec_name}))')
 
     def is_attachment(self):
         """Return whether this `FFstream` instance is an attachment stream."""
-        return self.codec_type == 'attachment'
+        return self._is_attachment
 
     def is_audio(self):
         """Return whether this `FFstream` instance is an audio stream."""
-        return self.codec_type == 'audio'
+        return self._is_audio
 
     def is_subtitle(self):
         """Return whether this `FFstream` instance is a subtitle stream."""
-        return self.codec_type == 'subtitle'
+        return self._is_subtitle
 
     def is_video(self):
         """Return whether this `FFstream` instance is a video stream."""
-        return self.codec_type == 'video'
+        return self._is_video
 
 
 class FFattachmentStream(FFstream):
@@ -970,17 +1487,18 @@ class FFattachmentStream(FFstream):
     Raises:
         FFprobeStreamSubclassError: ``(codec_type != "attachment")``
     """
+    __slots__ = ()
+
     def __init__(self, parsed_json):
         super().__init__(parsed_json)
         if self.codec_type != 'attachment':
             raise FFprobeStreamSubclassError(
-                    type(self).__qualname__, self.codec_type, 'attachment')
+                    self._NAME, self.codec_type, 'attachment')
 
     def __str__(self):
         """Return a string containing a human-readable summary of the object."""
-        return '%s(streams[%s]: %s(%s))' % \
-                (type(self).__qualname__, self.index,
-                        self.codec_type, self.codec_name)
+        return (f'{self._NAME}(streams[{self.index}]: '
+                f'{self.codec_type}({self.codec_name}))')
 
 
 class FFaudioStream(FFstream):
@@ -1009,30 +1527,29 @@ class FFaudioStream(FFstream):
     Raises:
         FFprobeStreamSubclassError: ``(codec_type != "audio")``
     """
+    __slots__ = ('num_channels', 'num_frames', 'channel_layout',
+            'sample_rate_Hz', 'bit_rate_bps', 'bit_rate_kbps')
+
     def __init__(self, parsed_json):
         super().__init__(parsed_json)
         if self.codec_type != 'audio':
             raise FFprobeStreamSubclassError(
-                    type(self).__qualname__, self.codec_type, 'audio')
+                    self._NAME, self.codec_type, 'audio')
 
         self.num_channels =     self.get_as_int('channels')
         self.num_frames =       self.get_as_int('nb_frames')
-        self.channel_layout =   self.get('channel_layout')
+        self.channel_layout =   parsed_json.get('channel_layout')
         self.sample_rate_Hz =   self.get_as_int('sample_rate')
         self.bit_rate_bps =     self.get_as_int('bit_rate')
-        try:
-            self.bit_rate_kbps = float(self.bit_rate_bps) / 1000.0
-        except (TypeError, ValueError):
-            self.bit_rate_kbps = None
+        self.bit_rate_kbps = self.get_as_float_scaled('bit_rate', 1000.0)
 
 
     def __str__(self):
         """Return a string containing a human-readable summary of the object."""
-        return '%s(streams[%s]: %s(%s): %s channels (%s), %s Hz, %s kb/s)' % \
-                (type(self).__qualname__, self.index,
-                        self.codec_type, self.codec_name,
-                        self.num_channels, self.channel_layout,
-                        self.sample_rate_Hz, self.bit_rate_kbps)
+        return (f'{self._NAME}(streams[{self.index}]: '
+                f'{self.codec_type}({self.codec_name}): '
+                f'{self.num_channels} channels ({self.channel_layout}), '
+                f'{self.sample_rate_Hz} Hz, {self.bit_rate_kbps} kb/s)')
 
 
 class FFsubtitleStream(FFstream):
@@ -1051,17 +1568,18 @@ class FFsubtitleStream(FFstream):
     Raises:
         FFprobeStreamSubclassError: ``(codec_type != "subtitle")``
     """
+    __slots__ = ()
+
     def __init__(self, parsed_json):
         super().__init__(parsed_json)
         if self.codec_type != 'subtitle':
             raise FFprobeStreamSubclassError(
-                    type(self).__qualname__, self.codec_type, 'subtitle')
+                    self._NAME, self.codec_type, 'subtitle')
 
     def __str__(self):
         """Return a string containing a human-readable summary of the object."""
-        return '%s(streams[%s]: %s(%s))' % \
-                (type(self).__qualname__, self.index,
-                        self.codec_type, self.codec_name)
+        return (f'{self._NAME}(streams[{self.index}]: '
+                f'{self.codec_type}({self.codec_name}))')
 
 
 class FFvideoStream(FFstream):
@@ -1092,32 +1610,31 @@ class FFvideoStream(FFstream):
     Raises:
         FFprobeStreamSubclassError: ``(codec_type != "video")``
     """
+    __slots__ = ('width', 'height', 'avg_frame_rate', 'r_frame_rate',
+            'num_frames', 'bit_rate_bps', 'bit_rate_kbps', 'side_data_list')
+
     def __init__(self, parsed_json):
         super().__init__(parsed_json)
         if self.codec_type != 'video':
             raise FFprobeStreamSubclassError(
-                    type(self).__qualname__, self.codec_type, 'video')
+                    self._NAME, self.codec_type, 'video')
 
         self.width =            self.get_as_int('width')
         self.height =           self.get_as_int('height')
-        self.avg_frame_rate =   self.get('avg_frame_rate')
-        self.r_frame_rate =     self.get('r_frame_rate')
+        self.avg_frame_rate =   parsed_json.get('avg_frame_rate')
+        self.r_frame_rate =     parsed_json.get('r_frame_rate')
         self.num_frames =       self.get_as_int('nb_frames')
         self.bit_rate_bps =     self.get_as_int('bit_rate')
-        try:
-            self.bit_rate_kbps = float(self.bit_rate_bps) / 1000.0
-        except (TypeError, ValueError):
-            self.bit_rate_kbps = None
+        self.bit_rate_kbps = self.get_as_float_scaled('bit_rate', 1000.0)
 
-        self.side_data_list =   self.get('side_data_list')
+        self.side_data_list =   parsed_json.get('side_data_list')
 
     def __str__(self):
         """Return a string containing a human-readable summary of the object."""
-        return '%s(streams[%s]: %s(%s): %sx%s, %s fps, %s kb/s)' % \
-                (type(self).__qualname__, self.index,
-                        self.codec_type, self.codec_name,
-                        self.width, self.height,
-                        self.avg_frame_rate, self.bit_rate_kbps)
+        return (f'{self._NAME}(streams[{self.index}]: '
+                f'{self.codec_type}({self.codec_name}): '
+                f'{self.width}x{self.height}, '
+                f'{self.avg_frame_rate} fps, {self.bit_rate_kbps} kb/s)')
 
     def get_frame_rate_as_ratio(self, key, default=None):
         """Return a frame-rate for `key` as 2-tuple `(numerator, denominator)`;
@@ -1161,10 +1678,11 @@ class FFvideoStream(FFstream):
         try:
             # Possible exception: `key` is not found.
             frame_rate = self.parsed_json[key]
-            # Possible exception: `frame_rate` doesn't match regex,
-            # so `None` is returned, which has no method `.groups()`.
-            (n, d) = re.match("^(-?[0-9]+)/(-?[0-9]+)$", frame_rate).groups()
-            # Possible exception: `int(n)` fails or `int(d)` fails.
+            # Possible exception: `frame_rate` is not a string.
+            (n, sep, d) = frame_rate.partition('/')
+            if not (sep and _is_int_token(n) and _is_int_token(d)):
+                # It doesn't look like "int/int".
+                return default
             return (int(n), int(d))
         except Exception as e:
             return default
@@ -1198,18 +1716,15 @@ class FFvideoStream(FFstream):
 
         This method will never raise an exception.
         """
-        try:
-            # Possible exception: `self.get_frame_rate_as_ratio(key)` fails,
-            # so its "default" `default` of `None` is returned,
-            # which cannot be 2-tuple deconstructed into `(n, d)`.
-            (n, d) = self.get_frame_rate_as_ratio(key)
-            if n <= 0 or d <= 0:
-                # Either `n` or `d` (or both!) is negative or zero.
-                return default
-            # Possible exception: `float(n)` fails or `float(d)` fails.
-            return (float(n) / float(d))
-        except Exception as e:
+        ratio = self.get_frame_rate_as_ratio(key)
+        if ratio is None:
+            return default
+        (n, d) = ratio
+        if n <= 0 or d <= 0:
+            # Either `n` or `d` (or both!) is negative or zero.
             return default
+        # True division of `int` yields a `float`.
+        return (n / d)
 
     def get_avg_frame_rate(self, default=None):
         """Return ``avg_frame_rate`` as a ``float``; else `default`.
@@ -1294,16 +1809,19 @@ class FFvideoStream(FFstream):
                 (for example, if you would rather return a pair ``(None, None)``
                 than a single ``None`` value, for 2-tuple deconstruction).
         """
-        try:
-            height = int(self.height)
-            width = int(self.width)
-            if self.get_frame_rotation(default=0) % 360 in (90, 270):
-                # Rotate the frame shape (orientation).
-                return (height, width)
-            else:
-                return (width, height)
-        except Exception as e:
+        # These are already `int` (or `None`), from `get_as_int`.
+        width = self.width
+        height = self.height
+        if width is None or height is None:
             return default
+        rotation = self.get_frame_rotation(default=0)
+        if not isinstance(rotation, (int, float)):
+            return default
+        if rotation % 360 in _ROTATED_ANGLES:
+            # Rotate the frame shape (orientation).
+            return (height, width)
+        else:
+            return (width, height)
 
     def get_frame_rotation(self, default=None):
         """Return frame rotation from ``side_data`` as ``int``; else `default`.
@@ -1311,19 +1829,31 @@ class FFvideoStream(FFstream):
         If `default` is not supplied, it defaults to ``None``, so this method
         will never raise an exception.
         """
-        try:
-            rotations = [d["rotation"] for d in self.side_data_list]
-            return rotations[0]
-        except Exception as e:
+        side_data_list = self.side_data_list
+        if not isinstance(side_data_list, list):
             return default
-
-    def get_side_data(self, internal=False):
+        # Return the rotation of the first side-data that has one.
+        for side_data in side_data_list:
+            if isinstance(side_data, Mapping):
+                rotation = side_data.get("rotation")
+                if rotation is not None:
+                    return rotation
+        return default
+
+    def get_side_data(self, internal=False, copy=True):
         """Return a list of video stream side-data.
 
         This method always returns a `list`, even if no `"side_data_list"`
         was found in the parsed JSON output (meaning that data attribute
         `self.side_data_list` has the value `None`).
+
+        If `copy` is false (and `internal` is false), the side-data is
+        returned without copying it, for callers that only iterate over it:
+        the internal list itself, or a new empty `list` if there is no list.
+        The caller must not modify the internal list.
         """
+        if not copy and not internal:
+            return (self.side_data_list if self.side_data_list is not None else [])
         if internal:
             # Return a reference to the internal list `self.side_data_list`.
             if self.side_data_list is None:
@@ -1335,17 +1865,20 @@ class FFvideoStream(FFstream):
             return (self.side_data_list[:] if self.side_data_list is not None else [])
 
 
-_KNOWN_FFSTREAM_SUBCLASSES = dict(
-    attachment= FFattachmentStream,
-    audio=      FFaudioStream,
-    subtitle=   FFsubtitleStream,
-    video=      FFvideoStream,
-)
+# Frame rotations (in degrees, modulo 360) that swap the width & height.
+_ROTATED_ANGLES = frozenset((90, 270))
+
+
+# Map each known ``codec_type`` to its derived class of `FFstream`.
+_KNOWN_FFSTREAM_SUBCLASSES = {
+    'attachment':   FFattachmentStream,
+    'audio':        FFaudioStream,
+    'subtitle':     FFsubtitleStream,
+    'video':        FFvideoStream,
+}
 
 def _construct_ffstream_subclass(parsed_json):
-    codec_type = parsed_json.get('codec_type')
-    if codec_type is not None:
-        constructor = _KNOWN_FFSTREAM_SUBCLASSES.get(codec_type)
-        if constructor is not None:
-            return constructor(parsed_json)
-    return FFstream(parsed_json)
\ No newline at end of file
+    # A missing (or unknown) codec type falls back to the base class.
+    constructor = _KNOWN_FFSTREAM_SUBCLASSES.get(
+            parsed_json.get('codec_type'), FFstream)
+    return constructor(parsed_json)
\ No newline at end of file
@@ -1,103 +1,276 @@
 import os
+import re
 import argparse
+import queue
+import collections
+import dataclasses
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, Iterable, Iterator, Optional, Union
 
-import ffprobePython.ffprobe3
-from Song_Metadata import SongMetadata
+from Song_Metadata import SongMetadata, MetadataCache, ScannedFiles
 from ISRC_Metadata import ISRCMetadata
 from ffprobePython import ffprobe3
 import requests
-import json
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import sqlite3
-from time import sleep
+from time import monotonic, sleep
 import logging
+import logging.handlers
+try:
+    import mutagen
+except ImportError:
+    mutagen = None
+try:
+    import av
+except ImportError:
+    av = None
+try:
+    import orjson
+except ImportError:
+    orjson = None
 logger = logging.getLogger(__name__)
 
 RequestUrl = "https://isrc-api.soundexchange.com/api/ext/recordings"
 authToken = "Token 1107ceca92667a15e8fc28acbcc789c90c09f491"
+# Seconds to wait for the api to connect and to respond
+RequestTimeout = 30
+# Number of songs looked up in the api at the same time
+ApiWorkers = 8
+# Number of looked up songs inserted into the db per transaction
+InsertBatchSize = 100
+# Number of songs submitted to the metadata reading processes at a time
+ReadBatchSize = 512
+# A valid ISRC: country code, registrant code, year and designation code, e.g. USRC17607839
+IsrcPattern = re.compile(r"[A-Z]{2}[A-Z0-9]{3}[0-9]{7}")
+# Only the codec type and tags of each stream are read from ffprobe's output.
+ffprobeEntries = "stream=codec_type:stream_tags"
+MusicFileExtensions = frozenset(('.flac', '.opus', '.mp3'))
+# Tag names read by mutagen that ffprobe reports under a different name
+MutagenTagNames = {"ALBUMARTIST": "album_artist", "ALBUM ARTIST": "album_artist"}
+# Results of explicit version searches by (artist, title, year). Releases of the same recording
+# under different ISRCs (album, single, compilation) share one search.
+# Reads and writes of a dict are atomic, so the lookup threads share it without a lock
+explicitSearchResults: dict[tuple[str, str, str], bool] = {}
 
-search_payload = {
-    "searchFields": {
-        "recordingArtistName": {
-            "value": ""
-        },
-        "recordingTitle": {
-            "value": ""
-        },
-        "releaseName": {
-            "value": ""
-        },
-        "releaseYear": "",
-        "recordingVersion": {
-            "value": ""
-        },
-        "recordingYear": "",
-        "recordingType": ""
-    },
-    "start": 0,
-    "number": 100,
-    "showReleases": False
-}
+
+class RateLimiter:
+    """Spaces out calls made from many threads so they start at least interval seconds apart"""
+    def __init__(self, interval: float) -> None:
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._next_time = 0.0
+
+    def acquire(self) -> None:
+        """Blocks until the next call is allowed to start"""
+        with self._lock:
+            now = monotonic()
+            wait = self._next_time - now
+            self._next_time = max(now, self._next_time) + self.interval
+        if wait > 0:
+            sleep(wait)
+
+
+# Rate limits the calls to the api. The interval is set from the --sleep argument
+apiRateLimiter = RateLimiter(1.0)
+
+
+class RateLimitedRetry(Retry):
+    """Retry that waits for apiRateLimiter before every retry, so retries are rate limited like the first call"""
+    def sleep(self, response=None) -> None:
+        super().sleep(response)
+        apiRateLimiter.acquire()
 
 
-def GetAllMusicFiles(root_dir: str) -> list[str]:
+# One session for every api call, so the connection to the api is kept alive and reused
+# instead of doing a new TCP and TLS handshake for every song.
+# The api calls are read only searches, so it is safe to retry them on a server error.
+# Retries back off exponentially, or wait as long as the api's Retry-After header asks,
+# and then wait for the rate limit like any other call.
+apiSession = requests.Session()
+apiSession.headers.update({'Authorization': authToken})
+apiSession.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=8,
+                                         max_retries=RateLimitedRetry(total=5, backoff_factor=0.5,
+                                                                      status_forcelist=[429, 500, 502, 503, 504],
+                                                                      allowed_methods=None,
+                                                                      respect_retry_after_header=True)))
+
+
+def PostToApi(payload: dict) -> requests.Response:
+    """Posts a search to the api once the rate limit allows it
+    :returns the response of the api
+    """
+    apiRateLimiter.acquire()
+    return apiSession.post(RequestUrl, json=payload, timeout=RequestTimeout)
+
+
+def ParseApiResponse(r: requests.Response):
+    """Parses the json body of an api response, with orjson when it is installed.
+    The body is parsed from its bytes, without decoding it to a str first
+    :raises ValueError if the body is not valid json
+    """
+    if orjson is not None:
+        return orjson.loads(r.content)
+    return r.json()
+
+def NormalizeIsrc(isrc: str) -> str:
+    """Converts an ISRC tag to the form the api expects: the first of several ';' separated values,
+    without hyphens or whitespace, in upper case (e.g. us-rc1-76-07839 -> USRC17607839)
+    """
+    isrc = isrc.split(';', 1)[0]
+    return ''.join(isrc.split()).replace('-', '').upper()
+
+def GetAllMusicFiles(root_dir: str) -> Iterator[str]:
     """Gets all files in a directory recursively that are flac, opus, mp3
-    :returns list of music files
+    Directories that can't be read are skipped, like os.walk does.
+    :returns iterator of music files
     """
-    files = []
-    for r, d, f in os.walk(root_dir):
-        for file in f:
-            if '.flac' in file or '.opus' in file or '.mp3' in file:
-                files.append(os.path.join(r, file))
-    return files
+    dirs = [root_dir]
+    while dirs:
+        try:
+            entries = os.scandir(dirs.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        dirs.append(entry.path)
+                    elif os.path.splitext(entry.name)[1].lower() in MusicFileExtensions and entry.is_file():
+                        yield entry.path
+                except OSError:
+                    continue
 
-def GetTrackMetaData(song_file_path:str) -> SongMetadata:
+def GetMutagenTags(song_file_path: str) -> Optional[dict]:
+    """Gets the tags of a song by reading its tag block with mutagen.
+    Tag names are converted to the names ffprobe reports for flac and opus (e.g. ARTIST, album_artist),
+    and tags with several values are joined with ';' like ffprobe does.
+    :returns the tags, or None if mutagen can't read the file
+    """
     try:
-        metadata = ffprobe3.probe(song_file_path)
+        # easy=True reads mp3 ID3 frames under the same names as vorbis comments
+        song = mutagen.File(song_file_path, easy=True)
+    except mutagen.MutagenError:
+        return None
+    if song is None:
+        return None
+    tags = {}
+    for name, values in (song.tags or {}).items():
+        name = name.upper()
+        tags[MutagenTagNames.get(name, name)] = ';'.join(values)
+    return tags
+
+def GetAudioStreamTags(song_file_path: str) -> Optional[dict]:
+    """Gets the tags of the first audio stream in a song.
+    Reads the tags in process with mutagen when it is installed, otherwise reads the file with PyAV
+    when it is installed, otherwise runs ffprobe.
+    :returns the tags, or None if the song has no audio stream
+    :raises if the file could not be probed
+    """
+    if mutagen is not None:
+        tags = GetMutagenTags(song_file_path)
+        if tags is not None:
+            return tags
+    if av is not None:
+        with av.open(song_file_path) as container:
+            audio = next(iter(container.streams.audio), None)
+            return dict(audio.metadata) if audio is not None else None
+    metadata = ffprobe3.probe_json(song_file_path, show_entries=ffprobeEntries, ffprobe_threads=1)
+    audio = next((s for s in metadata.get('streams', []) if s.get('codec_type') == 'audio'), None)
+    return audio.get('tags', {}) if audio is not None else None
+
+class ReadFailed:
+    """Returned by GetTrackMetaData when a song could not be read, unlike None which means it has no usable tags.
+    It is the class itself rather than an instance, so it is still the same object after being sent back from
+    a worker process
+    """
+
+def GetTrackMetaData(song_file_path:str) -> Optional[Union[SongMetadata, type[ReadFailed]]]:
+    try:
+        tags = GetAudioStreamTags(song_file_path)
     except Exception:
         logger.error(f"Could not probe file for metadata. path: {song_file_path}")
+        return ReadFailed
+    if tags is None:
+        logger.error(f"Could not find audio stream on file. path: {song_file_path}")
         return None
-    for s in metadata.streams:
-        if isinstance(s, ffprobePython.FFaudioStream):
-            try:
-                tags = s.parsed_json['tags']
-            except:
-                return None
-            try:
-                artist = tags['ARTIST']
-            except:
-                artist = ""
-            try:
-                album_artist = tags['album_artist']
-            except:
-                album_artist = ""
-            try:
-                title = tags['TITLE']
-            except:
-                title = ""
-            #TODO fix year
-            try:
-                year = tags['DATE']
-            except:
-                year = ""
-            try:
-                isrc = tags['ISRC']
-            except:
-                isrc = "error"
-            meta = SongMetadata(Artist=artist, AlbumArtist=album_artist, Title=title, Year=year, ISRC=isrc, FilePath=song_file_path)
-            """
-            Assuming streams[0] is FFaudioStream
-            metadata.streams[0].parsed_json['tags']
-            Tags = {
-            TITLE: STR,
-            ARTIST: STR,
-            ALBUM: STR,
-            ISRC: STR,
-            DATE: STR
-            }
-            """
-            return meta
-    logger.error(f"Could not find audio stream on file. path: {song_file_path}")
-    return None
+    if not tags:
+        return None
+    # Tag names are case insensitive in vorbis comments, so look them up in upper case
+    tags = {name.upper(): value for name, value in tags.items()}
+    artist = tags.get('ARTIST', "")
+    album_artist = tags.get('ALBUM_ARTIST', "")
+    title = tags.get('TITLE', "")
+    #TODO fix year
+    year = tags.get('DATE', "")
+    isrc = tags.get('ISRC', "error")
+    meta = SongMetadata(Artist=artist, AlbumArtist=album_artist, Title=title, Year=year, ISRC=isrc, FilePath=song_file_path)
+    """
+    Tags of the audio stream
+    Tags = {
+    TITLE: STR,
+    ARTIST: STR,
+    ALBUM: STR,
+    ISRC: STR,
+    DATE: STR
+    }
+    """
+    return meta
+
+def GetAllTrackMetaData(song_paths: Iterable[str], jobs: Optional[int] = None, cache: Optional[MetadataCache] = None,
+                        file_stat: Optional[Callable[[str], Optional[tuple[int, int]]]] = None
+                        ) -> Iterator[tuple[str, Optional[Union[SongMetadata, type[ReadFailed]]]]]:
+    """Gets the metadata of many songs, reading them in a pool of worker processes.
+    Each ffprobe is limited to a single thread so the pool doesn't oversubscribe the cpus.
+    :param jobs: number of worker processes, defaults to the number of cpus
+    :param cache: songs found in the cache are not read again, and newly read songs are added to it
+    :param file_stat: returns the (mtime_ns, size) of a path the caller has already stat'ed, or None,
+    so the cache doesn't stat the file again
+    :returns iterator of (path, metadata) pairs. The metadata is None if the song has no usable tags,
+    and ReadFailed if it could not be read. Songs that are not cached are read ReadBatchSize at a time,
+    so song_paths is consumed as it is walked instead of being read into memory first
+    """
+    # The api lookup threads may already be running when the first worker process starts. Forking then
+    # could copy locks held by those threads into the worker, so workers are started by a forkserver
+    # where it is available, and by the platform's default start method (spawn) elsewhere
+    mp_context = multiprocessing.get_context(
+        "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else None)
+    # Worker processes send their log records to this process, so only one process writes to myapp.log
+    log_queue = mp_context.Queue()
+    log_listener = logging.handlers.QueueListener(log_queue, *logging.getLogger().handlers)
+    log_listener.start()
+    try:
+        with ProcessPoolExecutor(max_workers=jobs, mp_context=mp_context,
+                                 initializer=ConfigureWorkerLogging, initargs=(log_queue,)) as executor:
+            uncached_paths = []
+            for path in song_paths:
+                data = cache.get(path, file_stat(path) if file_stat is not None else None) if cache is not None else None
+                if data is not None:
+                    yield path, data
+                    continue
+                uncached_paths.append(path)
+                if len(uncached_paths) >= ReadBatchSize:
+                    yield from ReadTrackMetaData(executor, uncached_paths, cache)
+                    uncached_paths = []
+            yield from ReadTrackMetaData(executor, uncached_paths, cache)
+    finally:
+        # The workers have exited, so every record they logged is already on the queue
+        log_listener.stop()
+
+def ReadTrackMetaData(executor: ProcessPoolExecutor, song_paths: Iterable[str],
+                      cache: Optional[MetadataCache]
+                      ) -> Iterator[tuple[str, Optional[Union[SongMetadata, type[ReadFailed]]]]]:
+    """Reads the metadata of songs in the executor's processes, and adds it to the cache
+    :returns iterator of (path, metadata) pairs in the order of song_paths
+    """
+    # The paths are iterated twice, once to submit them and once to pair them with their results
+    song_paths = list(song_paths)
+    for path, data in zip(song_paths, executor.map(GetTrackMetaData, song_paths, chunksize=32)):
+        if data is not None and data is not ReadFailed and cache is not None:
+            cache.put(path, data)
+        yield path, data
 
 def GetISRCMetadata(song:SongMetadata) -> ISRCMetadata:
     """
@@ -107,14 +280,14 @@ def GetISRCMetadata(song:SongMetadata) -> ISRCMetadata:
     :param song:
     :return:
     """
-    data = f'{{"searchFields":{{"isrc":"{song.ISRC}"}},"start":0,"number":10,"showReleases":false}}'
-    s = requests.session()
-    s.headers.update({'Authorization': authToken})
-    r = s.post(RequestUrl, data=data)
-    print(r.text)
+    data = {"searchFields": {"isrc": song.ISRC}, "start": 0, "number": 10, "showReleases": False}
+    r = PostToApi(data)
+    # The response text is only decoded for the log when debug logging is on
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"API response: {r.text}")
     try:
-        json_obj = json.loads(r.text)
-    except Exception as e:
+        json_obj = ParseApiResponse(r)
+    except ValueError as e:
             logger.error(f"Could not decode song. ISRC: {song.ISRC}; path: {song.FilePath}; json: {r.text}; exception: {e}")
             return None
 
@@ -122,92 +295,217 @@ def GetISRCMetadata(song:SongMetadata) -> ISRCMetadata:
         logger.error(f"Could not lookup information on song. ISRC: {song.ISRC}; path: {song.FilePath}")
         return None
 
-    metadata = ISRCMetadata(**json_obj['recordings'][0])
+    metadata = ISRCMetadata.from_isrc_response(json_obj['recordings'][0])
     return metadata
 
+def SearchPayload(artist: str, title: str, year: str) -> dict:
+    """Builds the payload of a search for recordings by artist, title and year.
+    A new dict is built for every call, so searches from different threads do not share it
+    """
+    return {
+        "searchFields": {
+            "recordingArtistName": {
+                "value": artist
+            },
+            "recordingTitle": {
+                "value": title
+            },
+            "releaseName": {
+                "value": ""
+            },
+            "releaseYear": "",
+            "recordingVersion": {
+                "value": ""
+            },
+            "recordingYear": year,
+            "recordingType": ""
+        },
+        "start": 0,
+        "number": 100,
+        "showReleases": False
+    }
+
 def DoesExplicitVersionExist(song:ISRCMetadata) -> bool:
-    global search_payload
-    search_payload["searchFields"]["recordingArtistName"]["value"] = song.recordingArtistName
-    search_payload["searchFields"]["recordingTitle"]["value"] = song.recordingTitle
-    search_payload["searchFields"]["recordingYear"] = song.recordingYear
-    payload = json.dumps(search_payload)
-    s = requests.session()
-    s.headers.update({'Authorization': authToken})
-    r = s.post(RequestUrl, data=payload)
-    print(r.text)
+    year = str(song.recordingYear) if song.recordingYear is not None else ""
+    key = (song.recordingArtistName, song.recordingTitle, year)
+    explicit = explicitSearchResults.get(key)
+    if explicit is not None:
+        return explicit
+    r = PostToApi(SearchPayload(*key))
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"API response: {r.text}")
     explict = False
     try:
-        dump = json.loads(r.text)
-    except Exception as e:
+        dump = ParseApiResponse(r)
+    except ValueError as e:
         logger.error(f"Could not parse response from api. API response: {r.text}; exception: {e}; Song:{song.isrc}")
         return False
 
     for rec in dump["recordings"]:
         if rec["isExplicit"] == "True":
             explict = True
+    # Only searches that succeeded are remembered, so a failed one is tried again by the next song
+    explicitSearchResults[key] = explict
     return explict
+
+def LookupSong(data: SongMetadata) -> Optional[tuple]:
+    """Looks up a song in the api and checks whether an explicit version of it exists
+    :returns the row to insert into the music table, or None if the song could not be looked up
+    """
+    isrcMetadata = GetISRCMetadata(data)
+    if isrcMetadata is None:
+        return None
+    if isrcMetadata.isExplicit:
+        doesExplicitExist = True
+    else:
+        doesExplicitExist = DoesExplicitVersionExist(isrcMetadata)
+    return (data.ISRC,
+            isrcMetadata.recordingTitle,
+            isrcMetadata.isrcFailureCode,
+            isrcMetadata.recordingArtistName,
+            isrcMetadata.recordingYear,
+            str(isrcMetadata.isValidIsrc),
+            isrcMetadata.recordingVersion,
+            isrcMetadata.duration,
+            str(isrcMetadata.isExplicit),
+            str(doesExplicitExist),
+            data.FilePath)
+
+def LookupSongWorker(data: SongMetadata, results: queue.Queue) -> None:
+    """Looks up a song on a worker thread and puts (song, row) on the results queue.
+    The row is None if the song could not be looked up
+    """
+    try:
+        row = LookupSong(data)
+    except Exception as e:
+        logger.error(f"Could not lookup song. ISRC: {data.ISRC}; path: {data.FilePath}; exception: {e}")
+        row = None
+    results.put((data, row))
+
+def InsertLookedUpSongs(db_connection: sqlite3.Connection, results: queue.Queue, pending_rows: list[tuple],
+                        scanned_files: ScannedFiles) -> None:
+    """Adds the rows of the songs that have been looked up so far to pending_rows,
+    and inserts them into the music table once there are InsertBatchSize of them.
+    Songs that could not be looked up are not marked as scanned, so they are retried on the next run.
+    Only the main thread writes to the db
+    """
+    while True:
+        try:
+            data, row = results.get_nowait()
+        except queue.Empty:
+            break
+        if row is None:
+            scanned_files.discard(data.FilePath)
+            continue
+        pending_rows.append(row)
+        scanned_files.add(data.FilePath)
+        print(f"Added {data.ISRC} to db")
+        logger.info(f"Finished lookup. path: {data.FilePath}")
+    if len(pending_rows) >= InsertBatchSize:
+        WriteSongRows(db_connection, pending_rows, scanned_files)
+
+def WriteSongRows(db_connection: sqlite3.Connection, pending_rows: list[tuple], scanned_files: ScannedFiles) -> None:
+    """Inserts pending_rows into the music table and the scanned paths into the scanned table
+    in one transaction, then clears them
+    """
+    if pending_rows:
+        db_connection.executemany("INSERT INTO music VALUES (?,?,?,?,?,?,?,?,?,?,?)", pending_rows)
+        pending_rows.clear()
+    scanned_files.flush()
+    db_connection.commit()
+
+def ConfigureLogging():
+    logging.basicConfig(filename='myapp.log', level=logging.INFO)
+
+def ConfigureWorkerLogging(log_queue: multiprocessing.Queue) -> None:
+    """Sends the log records of a worker process to log_queue, to be written by the main process"""
+    root_logger = logging.getLogger()
+    root_logger.setLevel(logging.INFO)
+    # No formatter, so the records are formatted once, by the main process's handlers
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
     
 
+def ScanLibrary(directory: str, db_connection: sqlite3.Connection, jobs: Optional[int] = None) -> None:
+    """Looks up the songs under directory that are new or modified since the last scan, and inserts the rows
+    of the songs found in the api into the music table. Rows are committed as they are inserted
+    :param jobs: number of processes reading song metadata, defaults to the number of cpus
+    """
+    metadata_cache = MetadataCache(db_connection)
+    # Files processed by an earlier run are skipped before their metadata is read
+    scanned_files = ScannedFiles(db_connection)
+    song_paths = (path for path in GetAllMusicFiles(directory) if not scanned_files.is_scanned(path))
+
+    db_cursor = db_connection.cursor()
+    # Songs are looked up in the api on worker threads, and their rows are inserted from this thread
+    lookup_results = queue.Queue()
+    # ISRCs already in the db, read once instead of querying the db for every song
+    db_isrcs = {row[0] for row in db_cursor.execute("SELECT isrc FROM music")}
+    submitted_isrcs = set()
+    # Lookups waiting for or running on the api workers. Only a few are queued ahead of the workers,
+    # so the walk over the library doesn't get far ahead of the api
+    inflight_lookups = collections.deque()
+    pending_rows = []
+    try:
+        with ThreadPoolExecutor(max_workers=ApiWorkers) as api_executor:
+            for song, data in GetAllTrackMetaData(song_paths, jobs, metadata_cache, scanned_files.get_stat):
+                logger.info(f"Starting lookup. path: {song}")
+                if data is ReadFailed:
+                    # Not marked as scanned, so the song is read again on the next run
+                    scanned_files.discard(song)
+                    continue
+                if data is None:
+                    scanned_files.add(song)
+                    continue
+                isrc = NormalizeIsrc(data.ISRC)
+                if IsrcPattern.fullmatch(isrc) is None:
+                    logger.info(f"Song has no valid ISRC. Skipping. ISRC: {data.ISRC}; path: {song}")
+                    scanned_files.add(song)
+                    continue
+                if isrc != data.ISRC:
+                    data = dataclasses.replace(data, ISRC=isrc)
+                if data.ISRC in submitted_isrcs:
+                    logger.info(f"Song already being looked up. Skipping. path: {song}")
+                    scanned_files.discard(song)
+                    continue
+                if data.ISRC in db_isrcs:
+                    logger.info(f"Song already in db. Skipping. path: {song}")
+                    scanned_files.add(song)
+                    continue
+                submitted_isrcs.add(data.ISRC)
+                inflight_lookups.append(api_executor.submit(LookupSongWorker, data, lookup_results))
+                if len(inflight_lookups) >= ApiWorkers * 2:
+                    inflight_lookups.popleft().result()
+                InsertLookedUpSongs(db_connection, lookup_results, pending_rows, scanned_files)
+    finally:
+        InsertLookedUpSongs(db_connection, lookup_results, pending_rows, scanned_files)
+        WriteSongRows(db_connection, pending_rows, scanned_files)
+        metadata_cache.flush()
+        db_cursor.close()
+        db_connection.commit()
+
+
 if __name__ == '__main__':
-    logging.basicConfig(filename='myapp.log', level=logging.INFO)
+    ConfigureLogging()
     
     parser = argparse.ArgumentParser(
         prog='Clean Music Locator',
         description='Clean Music Locator finds music in your library that are clean when an explict version exists')
     parser.add_argument('directory', type=str, help='Root directory of the music to be scanned')
-    parser.add_argument('-s', "--sleep", type=int, default=1000, help='Milliseconds to wait between calls')
+    parser.add_argument('-s', "--sleep", type=int, default=1000, help='Minimum milliseconds between calls to the api')
+    parser.add_argument('-j', "--jobs", type=int, default=None, help='Number of songs to read metadata from in parallel. Defaults to the number of cpus')
     args1 = parser.parse_args()
-    song_paths = GetAllMusicFiles(args1.directory)
     db_connection = sqlite3.connect("music.db")
-    
-    """
-    db -> dict[str(ISRC), ]
-    """
-    db_cursor = db_connection.cursor()
-    metadata_list = []
+    # The write-ahead log lets each batch commit without rewriting the db file,
+    # and it is only synced at checkpoints
+    db_connection.execute("PRAGMA journal_mode=WAL")
+    db_connection.execute("PRAGMA synchronous=NORMAL")
+    # Temporary tables and indices are kept in memory, and the page cache is 64MB instead of 2MB
+    db_connection.execute("PRAGMA temp_store=MEMORY")
+    db_connection.execute("PRAGMA cache_size=-65536")
+    apiRateLimiter.interval = args1.sleep/1000
     try:
-        for song in song_paths:
-            logger.info(f"Starting lookup. path: {song}")
-            print(f"Song: {song}")
-            data = GetTrackMetaData(song)
-            if data is None:
-                continue
-            rows = db_cursor.execute("SELECT isrc from music where isrc =?", [data.ISRC]).fetchall()
-            if len(rows) != 0:
-                logger.info(f"Song already in db. Skipping. path: {song}")
-                continue
-            # get metadata
-            isrcMetadata = GetISRCMetadata(data)
-            if isrcMetadata is None:
-                continue
-            if isrcMetadata.isExplicit == "True":
-                doesExplicitExist = True
-            else:    
-                doesExplicitExist = DoesExplicitVersionExist(isrcMetadata)
-            db_cursor.execute("INSERT INTO music VALUES (?,?,?,?,?,?,?,?,?,?,?)", 
-                                     [data.ISRC,\
-                                    isrcMetadata.recordingTitle,\
-                                    isrcMetadata.isrcFailureCode,\
-                                    isrcMetadata.recordingArtistName,\
-                                    isrcMetadata.recordingYear,\
-                                    isrcMetadata.isValidIsrc,\
-                                    isrcMetadata.recordingVersion,\
-                                    isrcMetadata.duration,\
-                                    isrcMetadata.isExplicit,\
-                                    str(doesExplicitExist),\
-                                    data.FilePath
-                                         ])
-            print(f"Added {data.ISRC} to db")
-            logger.info(f"Finished lookup. path: {song}")
-            sleep(args1.sleep/1000)
+        ScanLibrary(args1.directory, db_connection, args1.jobs)
     except Exception as e:
         print(e)
     finally:
-        db_cursor.close()
-        db_connection.commit()
-        db_connection.close()      
-
-
-
-
-
+        db_connection.close()
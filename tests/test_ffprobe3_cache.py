@@ -0,0 +1,70 @@
+import os
+import stat
+import sys
+
+import pytest
+
+from ffprobePython import ffprobe3
+
+# Prints the output of ffprobe for a flac file, and counts its runs in a file next to it
+FakeFFprobe = """#!{python}
+import json, sys
+with open({runs_path!r}, "a") as f:
+    f.write("run\\n")
+print(json.dumps({{"streams": [{{"index": 0, "codec_type": "audio", "codec_name": "flac",
+                                "tags": {{"ISRC": "USRC17607840"}}}}],
+                  "format": {{"filename": sys.argv[-1], "format_name": "flac", "nb_streams": 1}},
+                  "chapters": []}}))
+"""
+
+
+@pytest.fixture
+def fake_ffprobe(tmp_path):
+    runs_path = tmp_path / "runs"
+    runs_path.write_text("")
+    ffprobe_path = tmp_path / "ffprobe"
+    ffprobe_path.write_text(FakeFFprobe.format(python=sys.executable, runs_path=str(runs_path)))
+    ffprobe_path.chmod(ffprobe_path.stat().st_mode | stat.S_IXUSR)
+    return str(ffprobe_path), lambda: len(runs_path.read_text().splitlines())
+
+
+@pytest.fixture
+def media_path(tmp_path):
+    path = tmp_path / "song.flac"
+    path.write_bytes(b"flac")
+    return str(path)
+
+
+def test_cached_output_is_reused(tmp_path, fake_ffprobe, media_path):
+    ffprobe_path, runs = fake_ffprobe
+    cache_dir = str(tmp_path / "cache")
+    first = ffprobe3.probe_json(media_path, ffprobe_cmd_override=ffprobe_path, cache_dir=cache_dir)
+    second = ffprobe3.probe_json(media_path, ffprobe_cmd_override=ffprobe_path, cache_dir=cache_dir)
+
+    assert runs() == 1
+    assert second == first
+
+
+def test_modified_media_is_probed_again(tmp_path, fake_ffprobe, media_path):
+    ffprobe_path, runs = fake_ffprobe
+    cache_dir = str(tmp_path / "cache")
+    ffprobe3.probe_json(media_path, ffprobe_cmd_override=ffprobe_path, cache_dir=cache_dir)
+    with open(media_path, "ab") as f:
+        f.write(b"more")
+    ffprobe3.probe_json(media_path, ffprobe_cmd_override=ffprobe_path, cache_dir=cache_dir)
+
+    assert runs() == 2
+
+
+def test_clear_cache_only_deletes_cache_files(tmp_path, fake_ffprobe, media_path):
+    ffprobe_path, runs = fake_ffprobe
+    cache_dir = tmp_path / "cache"
+    ffprobe3.probe_json(media_path, ffprobe_cmd_override=ffprobe_path, cache_dir=str(cache_dir))
+    (cache_dir / "settings.json").write_text("{}")
+    (cache_dir / ("0" * 40 + ".json.tmp.123.456")).write_text("{")
+
+    assert ffprobe3.clear_cache(str(cache_dir)) == 2
+    assert os.listdir(cache_dir) == ["settings.json"]
+
+    ffprobe3.probe_json(media_path, ffprobe_cmd_override=ffprobe_path, cache_dir=str(cache_dir))
+    assert runs() == 2
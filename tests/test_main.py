@@ -0,0 +1,191 @@
+import json
+import os
+import sqlite3
+import threading
+from time import monotonic
+
+import pytest
+
+import main
+from Song_Metadata import SongMetadata
+
+MusicTable = ("CREATE TABLE music (isrc TEXT PRIMARY KEY, recordingTitle TEXT, isrcFailureCode INTEGER, "
+              "recordingArtistName TEXT, recordingYear TEXT, isValidIsrc TEXT, recordingVersion TEXT, "
+              "duration TEXT, isExplicit TEXT, doesExplicitExist TEXT, filePath TEXT)")
+
+
+class FakeResponse:
+    def __init__(self, body: dict) -> None:
+        self.text = json.dumps(body)
+        self.content = self.text.encode()
+
+    def json(self):
+        return json.loads(self.text)
+
+
+class FakeApi:
+    """Stands in for PostToApi, answering every ISRC and explicit version search"""
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.isrcs = []
+
+    def __call__(self, payload: dict) -> FakeResponse:
+        fields = payload["searchFields"]
+        if "isrc" not in fields:
+            return FakeResponse({"recordings": [{"isExplicit": "True"}]})
+        with self.lock:
+            self.isrcs.append(fields["isrc"])
+        return FakeResponse({"recordings": [{
+            "isrc": fields["isrc"], "recordingTitle": "Title", "isrcFailureCode": "0",
+            "recordingArtistName": "Artist", "recordingYear": "2001", "isValidIsrc": "true",
+            "recordingVersion": "", "duration": "PT3M", "isExplicit": "false"}]})
+
+
+@pytest.fixture
+def api(monkeypatch):
+    fake_api = FakeApi()
+    monkeypatch.setattr(main, "PostToApi", fake_api)
+    monkeypatch.setattr(main, "explicitSearchResults", {})
+    return fake_api
+
+
+@pytest.fixture
+def db_connection():
+    connection = sqlite3.connect(":memory:")
+    connection.execute(MusicTable)
+    yield connection
+    connection.close()
+
+
+class Library:
+    """Directory of songs whose metadata is looked up by file name instead of being read from the files"""
+    def __init__(self, directory) -> None:
+        self.directory = directory
+        self.isrcs = {}
+
+    def add(self, name: str, isrc) -> str:
+        """Adds a song. An isrc of None means the song has no tags, and main.ReadFailed means it can't be read"""
+        path = self.directory / name
+        path.write_bytes(b"flac")
+        self.isrcs[name] = isrc
+        return str(path)
+
+    def GetAllTrackMetaData(self, song_paths, jobs=None, cache=None, file_stat=None):
+        for path in song_paths:
+            isrc = self.isrcs[os.path.basename(path)]
+            if isrc is None or isrc is main.ReadFailed:
+                yield path, isrc
+            else:
+                yield path, SongMetadata(Artist="Artist", Title="Title", Year="2001", ISRC=isrc,
+                                         AlbumArtist="", FilePath=path)
+
+
+@pytest.fixture
+def library(tmp_path, monkeypatch):
+    songs = Library(tmp_path)
+    monkeypatch.setattr(main, "GetAllTrackMetaData", songs.GetAllTrackMetaData)
+    return songs
+
+
+def scanned_paths(db_connection) -> set:
+    return {row[0] for row in db_connection.execute("SELECT path FROM scanned")}
+
+
+def music_isrcs(db_connection) -> set:
+    return {row[0] for row in db_connection.execute("SELECT isrc FROM music")}
+
+
+@pytest.mark.parametrize("isrc", ["us-rc1-76-07840", "US RC1 76 07840", "usrc17607840;GBAYE0000001"])
+def test_normalize_isrc(isrc):
+    assert main.NormalizeIsrc(isrc) == "USRC17607840"
+
+
+def test_hyphenated_lowercase_isrc_is_looked_up_normalized(library, db_connection, api):
+    path = library.add("song.flac", "us-rc1-76-07840")
+    main.ScanLibrary(str(library.directory), db_connection, jobs=1)
+
+    assert api.isrcs == ["USRC17607840"]
+    assert music_isrcs(db_connection) == {"USRC17607840"}
+    assert scanned_paths(db_connection) == {path}
+
+
+def test_song_without_valid_isrc_is_skipped_and_marked_scanned(library, db_connection, api):
+    path = library.add("song.flac", "error")
+    main.ScanLibrary(str(library.directory), db_connection, jobs=1)
+
+    assert api.isrcs == []
+    assert scanned_paths(db_connection) == {path}
+
+
+def test_duplicate_isrc_is_not_marked_scanned(library, db_connection, api):
+    paths = {library.add("first.flac", "USRC17607840"), library.add("second.flac", "USRC17607840")}
+    main.ScanLibrary(str(library.directory), db_connection, jobs=1)
+
+    assert api.isrcs == ["USRC17607840"]
+    assert music_isrcs(db_connection) == {"USRC17607840"}
+    # Only the song that was looked up is scanned. The other is checked against the db on the next run
+    assert len(scanned_paths(db_connection)) == 1
+
+    main.ScanLibrary(str(library.directory), db_connection, jobs=1)
+    assert api.isrcs == ["USRC17607840"]
+    assert scanned_paths(db_connection) == paths
+
+
+def test_song_that_failed_to_read_is_not_marked_scanned(library, db_connection, api):
+    library.add("bad.flac", main.ReadFailed)
+    untagged_path = library.add("untagged.flac", None)
+    main.ScanLibrary(str(library.directory), db_connection, jobs=1)
+
+    assert api.isrcs == []
+    assert scanned_paths(db_connection) == {untagged_path}
+
+
+def test_scanned_song_is_not_looked_up_again(library, db_connection, api):
+    path = library.add("song.flac", "USRC17607840")
+    main.ScanLibrary(str(library.directory), db_connection, jobs=1)
+    db_connection.execute("DELETE FROM music")
+
+    main.ScanLibrary(str(library.directory), db_connection, jobs=1)
+    assert api.isrcs == ["USRC17607840"]
+
+    with open(path, "ab") as f:
+        f.write(b"more")
+    main.ScanLibrary(str(library.directory), db_connection, jobs=1)
+    assert api.isrcs == ["USRC17607840", "USRC17607840"]
+
+
+def test_rate_limiter_spaces_out_calls_from_threads():
+    rate_limiter = main.RateLimiter(0.05)
+    times = []
+    lock = threading.Lock()
+
+    def call():
+        rate_limiter.acquire()
+        with lock:
+            times.append(monotonic())
+
+    threads = [threading.Thread(target=call) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    times.sort()
+    assert all(later - earlier >= 0.04 for earlier, later in zip(times, times[1:]))
+
+
+def test_retries_wait_for_the_rate_limiter(monkeypatch):
+    class CountingRateLimiter:
+        calls = 0
+
+        def acquire(self):
+            self.calls += 1
+
+    rate_limiter = CountingRateLimiter()
+    monkeypatch.setattr(main, "apiRateLimiter", rate_limiter)
+    retry = main.RateLimitedRetry(total=5, backoff_factor=0)
+    retry.sleep()
+    # Retry.new() keeps the subclass for the following retries
+    retry.increment(method="POST", url="/").sleep()
+
+    assert rate_limiter.calls == 2
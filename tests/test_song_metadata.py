@@ -0,0 +1,90 @@
+import os
+import sqlite3
+
+import pytest
+
+from Song_Metadata import MetadataCache, ScannedFiles, SongMetadata
+
+
+@pytest.fixture
+def db_connection():
+    connection = sqlite3.connect(":memory:")
+    yield connection
+    connection.close()
+
+
+@pytest.fixture
+def song_path(tmp_path):
+    path = tmp_path / "song.flac"
+    path.write_bytes(b"flac")
+    return str(path)
+
+
+def make_song(path: str) -> SongMetadata:
+    return SongMetadata(Artist="Artist", Title="Title", Year="2001", ISRC="USRC17607840",
+                        AlbumArtist="Album Artist", FilePath=path)
+
+
+def test_metadata_cache_returns_entry_of_unchanged_file(db_connection, song_path):
+    cache = MetadataCache(db_connection)
+    assert cache.get(song_path) is None
+    cache.put(song_path, make_song(song_path))
+    cache.flush()
+
+    assert MetadataCache(db_connection).get(song_path) == make_song(song_path)
+
+
+def test_metadata_cache_entry_is_invalidated_by_mtime(db_connection, song_path):
+    cache = MetadataCache(db_connection)
+    cache.put(song_path, make_song(song_path))
+    cache.flush()
+
+    st = os.stat(song_path)
+    os.utime(song_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert MetadataCache(db_connection).get(song_path) is None
+
+
+def test_metadata_cache_entry_is_invalidated_by_size(db_connection, song_path):
+    cache = MetadataCache(db_connection)
+    cache.put(song_path, make_song(song_path))
+    cache.flush()
+
+    st = os.stat(song_path)
+    with open(song_path, "ab") as f:
+        f.write(b"more")
+    os.utime(song_path, ns=(st.st_atime_ns, st.st_mtime_ns))
+    assert MetadataCache(db_connection).get(song_path) is None
+
+
+def test_metadata_cache_uses_stat_of_caller(db_connection, song_path):
+    cache = MetadataCache(db_connection)
+    cache.put(song_path, make_song(song_path))
+    cache.flush()
+
+    st = os.stat(song_path)
+    cache = MetadataCache(db_connection)
+    assert cache.get(song_path, (st.st_mtime_ns, st.st_size)) == make_song(song_path)
+    assert cache.get(song_path, (st.st_mtime_ns, st.st_size + 1)) is None
+
+
+def test_scanned_file_is_skipped_until_it_changes(db_connection, song_path):
+    scanned_files = ScannedFiles(db_connection)
+    assert not scanned_files.is_scanned(song_path)
+    scanned_files.add(song_path)
+    scanned_files.flush()
+
+    assert ScannedFiles(db_connection).is_scanned(song_path)
+    with open(song_path, "ab") as f:
+        f.write(b"more")
+    assert not ScannedFiles(db_connection).is_scanned(song_path)
+
+
+def test_discarded_file_is_not_scanned(db_connection, song_path):
+    scanned_files = ScannedFiles(db_connection)
+    assert not scanned_files.is_scanned(song_path)
+    assert scanned_files.get_stat(song_path) is not None
+    scanned_files.discard(song_path)
+    scanned_files.flush()
+
+    assert scanned_files.get_stat(song_path) is None
+    assert not ScannedFiles(db_connection).is_scanned(song_path)